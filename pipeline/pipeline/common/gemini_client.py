@@ -4,6 +4,7 @@ Shared between Translator and Critics agents.
 """
 
 import os
+import threading
 import time
 import logging
 import backoff
@@ -34,6 +35,9 @@ class GeminiClient:
         self.client = genai.Client(api_key=self.api_key)
         self._last_request_time = 0
         self._rate_limit_delay = 6.0  # ~10 requests/min default
+        # Guards _last_request_time so threads sharing a client (e.g. via
+        # asyncio.to_thread) are spaced out instead of all sleeping the same delay
+        self._rate_limit_lock = threading.Lock()
 
         # Context caching support
         self.enable_caching = enable_caching
@@ -150,6 +154,20 @@ class GeminiClient:
             # Fallback estimation: ~4 chars per token
             return len(text) // 4
 
+    def _wait_for_rate_limit(self):
+        """
+        Sleep until this request's turn under the rate limit.
+
+        The slot is reserved under the lock before sleeping, so concurrent
+        callers get consecutive slots rather than the same one.
+        """
+        with self._rate_limit_lock:
+            now = time.time()
+            start = max(now, self._last_request_time + self._rate_limit_delay)
+            self._last_request_time = start
+        if start > now:
+            time.sleep(start - now)
+
     @backoff.on_exception(
         backoff.expo,
         (Exception),
@@ -182,9 +200,7 @@ class GeminiClient:
         target_model = model or self.model
 
         # Enforce rate limit
-        elapsed = time.time() - self._last_request_time
-        if elapsed < self._rate_limit_delay:
-            time.sleep(self._rate_limit_delay - elapsed)
+        self._wait_for_rate_limit()
 
         if safety_settings is None:
             safety_settings = [
@@ -254,7 +270,8 @@ class GeminiClient:
             duration = time.time() - start_time
             logger.info(f"Received Gemini response in {duration:.2f}s (finish_reason: {response.candidates[0].finish_reason if response.candidates else 'N/A'})")
 
-            self._last_request_time = time.time()
+            with self._rate_limit_lock:
+                self._last_request_time = max(self._last_request_time, time.time())
 
             usage = response.usage_metadata
             input_tokens = usage.prompt_token_count if usage else 0
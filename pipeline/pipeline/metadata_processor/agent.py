@@ -20,13 +20,24 @@ It only updates the translation fields without touching:
 Supports multi-language configuration (EN, VN, etc.)
 """
 
+import asyncio
+import io
 import json
 import logging
 import argparse
+import re
 import sys
 import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional, Any
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from pipeline.common.gemini_client import GeminiClient
 from pipeline.config import (
     get_config_section, PROMPTS_DIR, get_target_language, get_language_config
@@ -52,7 +63,96 @@ VIETNAMESE_NUMBERS = {
     'Sáu': '6', 'Bảy': '7', 'Tám': '8', 'Chín': '9', 'Mười': '10'
 }
 
+# Banner line for sequel-optimization log sections
+_SEP70 = "=" * 70
+
+# Sequel chapter-title translation: titles per request and max requests in flight
+CHAPTER_TITLE_BATCH_SIZE = 8
+CHAPTER_TITLE_CONCURRENCY = 4
+
+_JSON_DECODER = json.JSONDecoder()
+
+# Opening markdown code fence (```json or bare ```)
+_CODE_FENCE_RE = re.compile(r'```(?:json)?')
+
+# Write buffer for metadata/manifest JSON: the indent=2 encoder emits many
+# small chunks, a large buffer turns them into a handful of write() calls
+JSON_WRITE_BUFFER_SIZE = 1 << 20
+
+
+@lru_cache(maxsize=16)
+def _read_prompt(path: str, mtime_ns: int) -> str:
+    """Read a prompt file; keyed on mtime so edits on disk invalidate the cache."""
+    return Path(path).read_text(encoding='utf-8')
+
+
+def _write_json(path: Path, data: Any) -> None:
+    """
+    Write data as pretty-printed UTF-8 JSON.
+
+    Uses orjson when installed (encodes straight to bytes in C); otherwise
+    falls back to the stdlib encoder through a large write buffer.
+    """
+    if ORJSON_AVAILABLE:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        return
+    with open(path, 'wb', buffering=0) as raw, \
+            io.BufferedWriter(raw, buffer_size=JSON_WRITE_BUFFER_SIZE) as buf, \
+            io.TextIOWrapper(buf, encoding='utf-8') as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+def _extract_json(content: str) -> Dict[str, Any]:
+    """
+    Extract the first JSON object from a Gemini response.
+
+    Tolerates markdown code fences and any prose before or after the
+    object: decoding starts at the first '{' (inside the first code fence,
+    if there is one) and stops at its matching '}'. A missing closing
+    fence is fine.
+
+    Raises:
+        ValueError: If the response contains no JSON object.
+    """
+    fence = _CODE_FENCE_RE.search(content)
+    start = content.find('{', fence.end()) if fence else -1
+    if start < 0:
+        start = content.find('{')
+    if start < 0:
+        raise ValueError("No JSON object found in response")
+    obj, _ = _JSON_DECODER.raw_decode(content, start)
+    return obj
+
+
+# Per number word: (word, lowercase word, arabic, chapter-prefix patterns),
+# e.g. "Chuyện Hai", "Hồi thứ hai"
+_VN_CHAPTER_PATTERNS = tuple(
+    (
+        vn_word,
+        vn_word.lower(),
+        arabic,
+        (
+            f'Chuyện {vn_word}',
+            f'Chuyện {vn_word.lower()}',
+            f'thứ {vn_word.lower()}',
+            f'Hồi {vn_word}',
+            f'Hồi {vn_word.lower()}',
+        ),
+    )
+    for vn_word, arabic in VIETNAMESE_NUMBERS.items()
+)
+
+# Subtitle separator followed by a non-blank remainder (leftmost separator wins)
+_SUBTITLE_RE = re.compile(r'(\u3000|:|：| - |－)(.*\S)', re.DOTALL)
 
+
+def _extract_subtitle(text: str) -> str:
+    """Return the subtitle including its leading separator, or '' if none."""
+    match = _SUBTITLE_RE.search(text)
+    return match.group(0) if match else ''
+
+
+@lru_cache(maxsize=4096)
 def standardize_chapter_title(title: str, target_language: str = 'vn') -> str:
     """
     Standardize chapter titles to consistent Vietnamese format.
@@ -83,15 +183,6 @@ def standardize_chapter_title(title: str, target_language: str = 'vn') -> str:
     title = title.strip()
     original_title = title
     
-    # Helper function to extract subtitle (everything after separator)
-    def extract_subtitle(text, separators=['　', ':', '：', ' - ', '－']):
-        for sep in separators:
-            if sep in text:
-                parts = text.split(sep, 1)
-                if len(parts) == 2 and parts[1].strip():
-                    return sep + parts[1]  # Include separator
-        return ''
-    
     # Prologue patterns (no subtitle expected)
     if title in ['プロローグ', 'Khúc Dạo Đầu', 'Lời Mở Đầu', 'Mở Đầu']:
         return 'Chương Mở Đầu'
@@ -113,7 +204,6 @@ def standardize_chapter_title(title: str, target_language: str = 'vn') -> str:
     # Japanese: 第二話 or 第二章 → Chương 2 (+ subtitle if present)
     if title.startswith('第') and ('話' in title or '章' in title):
         # Extract the number between 第 and 話/章
-        import re
         match = re.match(r'^第([一二三四五六七八九十]+)([話章])(.*)', title)
         if match:
             jp_num = match.group(1)
@@ -126,24 +216,15 @@ def standardize_chapter_title(title: str, target_language: str = 'vn') -> str:
                 return f'Chương {arabic}{subtitle}'
     
     # Vietnamese variants: Chuyện Hai, Hồi thứ năm → Chương 2, Chương 5 (+ subtitle)
-    for vn_word, arabic in VIETNAMESE_NUMBERS.items():
-        # Match: "Chuyện Hai", "Hồi thứ hai"
-        patterns = [
-            f'Chuyện {vn_word}',
-            f'Chuyện {vn_word.lower()}',
-            f'thứ {vn_word.lower()}',
-            f'Hồi {vn_word}',
-            f'Hồi {vn_word.lower()}'
-        ]
-        
+    for vn_word, vn_word_lower, arabic, patterns in _VN_CHAPTER_PATTERNS:
         for pattern in patterns:
             if pattern in title:
                 # Extract subtitle after the pattern
-                subtitle = extract_subtitle(title)
+                subtitle = _extract_subtitle(title)
                 return f'Chương {arabic}{subtitle}'
         
         # Direct match: just the number word (no subtitle expected)
-        if title == vn_word or title == vn_word.lower():
+        if title == vn_word or title == vn_word_lower:
             return f'Chương {arabic}'
     
     # Already standardized: Chương X (preserve as-is with any subtitle)
@@ -167,6 +248,12 @@ class MetadataProcessor:
     - keigo_switch, speech_pattern, character_arc, occurrences tracking
     - Richer metadata vs flat JP→EN name mapping
     """
+
+    __slots__ = (
+        'work_dir', 'manifest_path', 'target_language', 'lang_config',
+        'language_name', 'language_code', 'manifest', 'client',
+        'prompt_path', 'metadata_key'
+    )
     
     def __init__(self, work_dir: Path, model: str = None, target_language: str = None):
         """
@@ -192,8 +279,7 @@ class MetadataProcessor:
         if not self.manifest_path.exists():
             raise FileNotFoundError(f"Manifest not found at {self.manifest_path}")
 
-        with open(self.manifest_path, 'r', encoding='utf-8') as f:
-            self.manifest = json.load(f)
+        self.manifest = json.loads(self.manifest_path.read_text(encoding='utf-8'))
 
         # Prioritize hardcoded gemini-2.5-flash for metadata (fast, simple task)
         # Only use config.yaml model if explicitly overridden via parameter
@@ -212,6 +298,10 @@ class MetadataProcessor:
         # Language-specific metadata key suffix
         self.metadata_key = f"metadata_{self.target_language}"  # e.g., metadata_en, metadata_vn
     
+    def _load_prompt(self) -> str:
+        """Return the system prompt text, re-reading only if the file changed."""
+        return _read_prompt(str(self.prompt_path), self.prompt_path.stat().st_mtime_ns)
+
     def _update_manifest_preserve_schema(
         self,
         title_en: str,
@@ -236,6 +326,7 @@ class MetadataProcessor:
             extra_fields: Optional extra fields to add
         """
         existing_metadata_en = self.manifest.get("metadata_en", {})
+        now_iso = datetime.datetime.now().isoformat()
         
         # Check if v3 enhanced schema exists
         has_v3_schema = (
@@ -265,17 +356,20 @@ class MetadataProcessor:
                 if isinstance(existing_chapters, list):
                     # List format: [{"id": "chapter_01", "title_en": [...], ...}]
                     for ch in existing_chapters:
-                        ch_id = ch.get("id", "")
-                        if ch_id in chapters:
-                            ch["title_en"] = chapters[ch_id]
+                        new_title = chapters.get(ch.get("id", ""))
+                        if new_title is not None and ch.get("title_en") != new_title:
+                            ch["title_en"] = new_title
                 elif isinstance(existing_chapters, dict):
                     # Dict format: {"chapter_01": {"title_jp": ..., "title_en": [...]}}
                     for ch_id, ch_data in existing_chapters.items():
-                        if ch_id in chapters:
-                            if isinstance(ch_data, dict):
-                                ch_data["title_en"] = chapters[ch_id]
-                            else:
-                                existing_chapters[ch_id] = chapters[ch_id]
+                        new_title = chapters.get(ch_id)
+                        if new_title is None:
+                            continue
+                        if isinstance(ch_data, dict):
+                            if ch_data.get("title_en") != new_title:
+                                ch_data["title_en"] = new_title
+                        elif ch_data != new_title:
+                            existing_chapters[ch_id] = new_title
             else:
                 # No existing chapters, add simple format
                 existing_metadata_en["chapters"] = [
@@ -289,7 +383,7 @@ class MetadataProcessor:
                     existing_metadata_en[key] = value
             
             # Add timestamp
-            existing_metadata_en["translation_timestamp"] = datetime.datetime.now().isoformat()
+            existing_metadata_en["translation_timestamp"] = now_iso
             
             self.manifest["metadata_en"] = existing_metadata_en
             
@@ -318,15 +412,19 @@ class MetadataProcessor:
                 "glossary": glossary or {},
                 "target_language": self.target_language,
                 "language_code": self.language_code,
-                "timestamp": datetime.datetime.now().isoformat(),
+                "timestamp": now_iso,
                 **(extra_fields or {})
             }
         
+        # Keep manifest chapters in canonical TOC order so readers can iterate as-is
+        if "chapters" in self.manifest:
+            self.manifest["chapters"].sort(key=lambda ch: ch.get("toc_order", 999))
+        
         # Also update chapter title_en in manifest chapters list
         for ch_manifest in self.manifest.get("chapters", []):
-            ch_id = ch_manifest.get("id", "")
-            if ch_id in chapters:
-                ch_manifest["title_en"] = chapters[ch_id]
+            new_title = chapters.get(ch_manifest.get("id", ""))
+            if new_title is not None and ch_manifest.get("title_en") != new_title:
+                ch_manifest["title_en"] = new_title
         
         # Update pipeline state
         if "pipeline_state" not in self.manifest:
@@ -334,7 +432,7 @@ class MetadataProcessor:
         self.manifest["pipeline_state"]["metadata_processor"] = {
             "status": "completed",
             "target_language": self.target_language,
-            "timestamp": datetime.datetime.now().isoformat(),
+            "timestamp": now_iso,
             "schema_preserved": has_v3_schema
         }
         
@@ -362,24 +460,23 @@ class MetadataProcessor:
             
             if manifest_path.exists() and metadata_en_path.exists():
                 try:
-                    with open(manifest_path, 'r') as f:
-                        m_data = json.load(f)
+                    m_data = json.loads(manifest_path.read_text(encoding='utf-8'))
                     other_title = m_data.get("metadata", {}).get("title", "")
                     
                     # Heuristic: Shared first 10 chars indicates same series
                     if current_title[:10] == other_title[:10]:
                         # Load metadata_en
-                        with open(metadata_en_path, 'r') as f:
-                            metadata_en = json.load(f)
+                        metadata_en = json.loads(metadata_en_path.read_text(encoding='utf-8'))
                         
                         # Load character roster from name_registry.json
                         name_registry_path = vol_dir / ".context" / "name_registry.json"
                         character_roster = {}
                         if name_registry_path.exists():
                             try:
-                                with open(name_registry_path, 'r') as f:
-                                    # name_registry.json is a flat dict: {jp_name: en_name}
-                                    character_roster = json.load(f)
+                                # name_registry.json is a flat dict: {jp_name: en_name}
+                                character_roster = json.loads(
+                                    name_registry_path.read_text(encoding='utf-8')
+                                )
                             except Exception as e:
                                 logger.warning(f"Could not load name registry: {e}")
                         
@@ -393,17 +490,16 @@ class MetadataProcessor:
                         chapters = []
                         if 'chapters' in metadata_en:
                             chapters_data = metadata_en['chapters']
+                            # Original JP titles from manifest, indexed by chapter id
+                            manifest_titles_by_id = {
+                                c['id']: c.get('title', '') for c in m_data.get('chapters', [])
+                            }
                             
                             # Handle both formats: list or dict
                             if isinstance(chapters_data, list):
                                 # List format: [{'id': '01', 'title_en': 'Title'}, ...]
                                 for ch in chapters_data:
-                                    # Find original JP title from manifest
-                                    manifest_chapters = m_data.get('chapters', [])
-                                    jp_title = next(
-                                        (c['title'] for c in manifest_chapters if c['id'] == ch['id']),
-                                        ''
-                                    )
+                                    jp_title = manifest_titles_by_id.get(ch['id'], '')
                                     if jp_title:
                                         chapters.append({
                                             'id': ch['id'],
@@ -412,12 +508,8 @@ class MetadataProcessor:
                                         })
                             elif isinstance(chapters_data, dict):
                                 # Dict format: {'01': 'Chapter Title', ...}
-                                manifest_chapters = m_data.get('chapters', [])
                                 for ch_id, title_en in chapters_data.items():
-                                    jp_title = next(
-                                        (c['title'] for c in manifest_chapters if c['id'] == ch_id),
-                                        ''
-                                    )
+                                    jp_title = manifest_titles_by_id.get(ch_id, '')
                                     if jp_title:
                                         chapters.append({
                                             'id': ch_id,
@@ -439,6 +531,16 @@ class MetadataProcessor:
                     continue
         return None
     
+    @staticmethod
+    def _build_ruby_index(ruby_names: List[Dict]) -> Dict[str, Dict]:
+        """
+        Index ruby-extracted names by kanji.
+
+        Entries without a kanji field are dropped; for duplicate kanji the
+        last entry wins while keeping first-seen order.
+        """
+        return {n['kanji']: n for n in ruby_names if n.get('kanji')}
+
     def _batch_translate_ruby(
         self,
         ruby_names: List[Dict],
@@ -529,13 +631,7 @@ class MetadataProcessor:
             )
             
             # Parse response
-            content = response.content.strip()
-            if content.startswith("```json"):
-                content = content[7:-3].strip()
-            elif content.startswith("```"):
-                content = content[3:-3].strip()
-            
-            translations = json.loads(content)
+            translations = _extract_json(response.content)
             
             # Merge with inherited
             name_registry = {**inherited_names, **translations.get("names", {})}
@@ -549,12 +645,68 @@ class MetadataProcessor:
             # Fallback: return inherited only
             return inherited_names.copy()
 
+    def _translate_chapter_titles(
+        self,
+        chapter_titles: List[Dict],
+        system_prompt: str
+    ) -> Dict[str, str]:
+        """
+        Translate chapter titles in concurrent batches.
+
+        Titles are split into batches of CHAPTER_TITLE_BATCH_SIZE and sent to
+        Gemini with at most CHAPTER_TITLE_CONCURRENCY requests in flight, so
+        wall time tracks the slowest batch rather than the sum of all batches.
+
+        Args:
+            chapter_titles: Chapter dicts with 'id' and 'title_jp'
+            system_prompt: System instruction for the metadata prompt
+
+        Returns:
+            Dict mapping chapter_id to translated title. A batch whose
+            response cannot be parsed falls back to its raw titles.
+        """
+        batches = [
+            chapter_titles[i:i + CHAPTER_TITLE_BATCH_SIZE]
+            for i in range(0, len(chapter_titles), CHAPTER_TITLE_BATCH_SIZE)
+        ]
+
+        async def translate_batch(batch: List[Dict], semaphore: asyncio.Semaphore) -> Dict[str, str]:
+            # Simplified prompt: only chapter titles
+            prompt = (
+                f"Translate these chapter titles to {self.language_name}:\n\n"
+                f"{json.dumps(batch, indent=2, ensure_ascii=False)}\n\n"
+                f"Return JSON format: {{'chapters': [{{'id': 'XX', 'title_en': '...'}}]}}"
+            )
+            async with semaphore:
+                response = await asyncio.to_thread(
+                    self.client.generate,
+                    prompt=prompt,
+                    system_instruction=system_prompt,
+                    temperature=0.3
+                )
+            try:
+                result = _extract_json(response.content)
+                return {ch['id']: ch['title_en'] for ch in result.get('chapters', [])}
+            except Exception as e:
+                logger.error(f"  ✗ Chapter translation failed: {e}")
+                # Fallback: use raw titles for this batch
+                return {ch['id']: ch['title_jp'] for ch in batch}
+
+        async def translate_all() -> List[Dict[str, str]]:
+            semaphore = asyncio.Semaphore(CHAPTER_TITLE_CONCURRENCY)
+            return await asyncio.gather(*(translate_batch(b, semaphore) for b in batches))
+
+        translations = {}
+        for batch_translations in asyncio.run(translate_all()):
+            translations.update(batch_translations)
+        return translations
+
     def _process_sequel_metadata_optimized(
         self, 
         parent_data: Dict, 
         original_metadata: Dict,
         chapter_titles: List[Dict], 
-        ruby_names: List
+        ruby_index: Dict[str, Dict]
     ) -> None:
         """
         Optimized sequel processing: Copy predecessor metadata directly,
@@ -564,11 +716,11 @@ class MetadataProcessor:
             parent_data: Predecessor volume data (from detect_sequel_parent)
             original_metadata: Current volume's original metadata
             chapter_titles: Current volume's chapter titles
-            ruby_names: Current volume's ruby-extracted names
+            ruby_index: Current volume's ruby-extracted names, keyed by kanji
         """
-        logger.info("="*70)
+        logger.info(_SEP70)
         logger.info("🎯 SEQUEL OPTIMIZATION: Direct metadata inheritance")
-        logger.info("="*70)
+        logger.info(_SEP70)
         
         predecessor_volume = parent_data.get('source_volume', 'Unknown')
         logger.info(f"📦 Inheriting from: {predecessor_volume}")
@@ -648,53 +800,24 @@ class MetadataProcessor:
         if new_chapter_titles:
             logger.info(f"\n📝 Translating {len(new_chapter_titles)} NEW chapter titles...")
             
-            with open(self.prompt_path, 'r', encoding='utf-8') as f:
-                system_prompt = f.read()
-            
-            # Simplified prompt: only chapter titles
-            prompt = (
-                f"Translate these chapter titles to {self.language_name}:\n\n"
-                f"{json.dumps(new_chapter_titles, indent=2, ensure_ascii=False)}\n\n"
-                f"Return JSON format: {{'chapters': [{{'id': 'XX', 'title_en': '...'}}]}}"
-            )
+            system_prompt = self._load_prompt()
+            new_translations = self._translate_chapter_titles(new_chapter_titles, system_prompt)
+            for ch_id, title in new_translations.items():
+                chapter_translations[ch_id] = title
+                logger.info(f"  ✨ Chapter '{ch_id}': {title}")
             
-            response = self.client.generate(
-                prompt=prompt,
-                system_instruction=system_prompt,
-                temperature=0.3
-            )
-            
-            try:
-                content = response.content.strip()
-                if content.startswith("```json"):
-                    content = content[7:-3].strip()
-                elif content.startswith("```"):
-                    content = content[3:-3].strip()
-                
-                result = json.loads(content)
-                
-                for ch in result.get('chapters', []):
-                    chapter_translations[ch['id']] = ch['title_en']
-                    logger.info(f"  ✨ Chapter '{ch['id']}': {ch['title_en']}")
-                
-                logger.info(f"  ✓ Translated {len(new_chapter_titles)} new chapters")
-                
-            except Exception as e:
-                logger.error(f"  ✗ Chapter translation failed: {e}")
-                # Fallback: copy from original metadata or use raw titles
-                for ch in new_chapter_titles:
-                    chapter_translations[ch['id']] = ch['title_jp']
+            logger.info(f"  ✓ Translated {len(new_chapter_titles)} new chapters")
         else:
             logger.info("  ✓ All chapter titles found in predecessor (0 new chapters)")
         
         metadata_translated['chapters'] = chapter_translations
         
         # === STEP 3: Handle NEW character names ===
-        inherited_char_keys = set(metadata_translated['character_names'].keys())
-        new_ruby_names = [
-            name for name in ruby_names 
-            if name.get('kanji', '') not in inherited_char_keys
-        ]
+        new_kanji = ruby_index.keys() - metadata_translated['character_names'].keys()
+        new_ruby_names = (
+            [entry for kanji, entry in ruby_index.items() if kanji in new_kanji]
+            if new_kanji else []
+        )
         
         if new_ruby_names:
             logger.info(f"\n👥 Translating {len(new_ruby_names)} NEW character names...")
@@ -718,8 +841,7 @@ class MetadataProcessor:
         output_filename = f"metadata_{self.target_language}.json"
         output_path = self.work_dir / output_filename
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(metadata_translated, f, indent=2, ensure_ascii=False)
+        _write_json(output_path, metadata_translated)
         
         logger.info(f"\n💾 Saved to {output_path}")
         
@@ -741,16 +863,15 @@ class MetadataProcessor:
             extra_fields={"inherited_from": predecessor_volume}
         )
         
-        with open(self.manifest_path, 'w', encoding='utf-8') as f:
-            json.dump(self.manifest, f, indent=2, ensure_ascii=False)
+        _write_json(self.manifest_path, self.manifest)
         
-        logger.info("="*70)
+        logger.info(_SEP70)
         logger.info("✅ SEQUEL OPTIMIZATION COMPLETE - API calls minimized!")
         logger.info(f"   • Inherited: {len(parent_data.get('character_roster', {}))} names, "
                     f"{len(parent_data.get('glossary', {}))} terms")
         logger.info(f"   • New translations: {len(new_chapter_titles)} chapters, "
                     f"{len(new_ruby_names)} names")
-        logger.info("="*70)
+        logger.info(_SEP70)
 
     def process_metadata(self, ignore_sequel: bool = False):
         """Translate metadata and save to metadata_en.json."""
@@ -778,6 +899,7 @@ class MetadataProcessor:
         
         # Get ruby-extracted character names
         ruby_names = self.manifest.get("ruby_names", [])
+        ruby_index = self._build_ruby_index(ruby_names)
         logger.info(f"Ruby entries: {len(ruby_names)} character names")
         
         # Check for sequel inheritance
@@ -792,67 +914,24 @@ class MetadataProcessor:
                 parent_data, 
                 original_metadata, 
                 chapter_titles, 
-                ruby_names
+                ruby_index
             )
             
-        inheritance_context = ""
-        if parent_data:
-            match_title = parent_data.get('title_en', 'Unknown')
-            match_author = parent_data.get('author_en', 'Unknown')
-            character_roster = parent_data.get('character_roster', {})
-            glossary = parent_data.get('glossary', {})
-            
-            logger.info(f"✨ Sequel Detected! Inheriting context from: {match_title}")
-            logger.info(f"   Characters: {len(character_roster)}, Glossary terms: {len(glossary)}")
-            
-            # Build comprehensive inheritance context
-            context_parts = [
-                "\n" + "="*60,
-                "IMPORTANT - SEQUEL INHERITANCE (MAINTAIN CONSISTENCY)",
-                "="*60,
-                f"\nSeries Title: {match_title}",
-                f"Author Name: {match_author}\n"
-            ]
-            
-            # Add character roster
-            if character_roster:
-                context_parts.append("\nCHARACTER ROSTER (use these exact spellings):")
-                for jp_name, en_name in character_roster.items():
-                    context_parts.append(f"  {jp_name} → {en_name}")
-                context_parts.append("")
-            
-            # Add glossary terms
-            if glossary:
-                context_parts.append("GLOSSARY (established terminology):")
-                for jp_term, en_term in glossary.items():
-                    context_parts.append(f"  {jp_term} → {en_term}")
-                context_parts.append("")
-            
-            context_parts.append("="*60)
-            context_parts.append("Ensure all character names and terms above remain consistent.")
-            context_parts.append("Only translate NEW characters/terms not listed above.\n")
-            
-            inheritance_context = "\n".join(context_parts)
-        
         # Batch translate ruby-extracted character names
-        if ruby_names:
+        if ruby_index:
             logger.info("Batch translating ruby entries...")
-            name_registry = self._batch_translate_ruby(
-                ruby_names, parent_data
-            )
+            name_registry = self._batch_translate_ruby(list(ruby_index.values()))
         else:
             name_registry = {}
         
         # No term glossary in simplified version
         term_glossary = {}
         
-        with open(self.prompt_path, 'r', encoding='utf-8') as f:
-            system_prompt = f.read()
+        system_prompt = self._load_prompt()
             
         prompt = (
             f"Original Metadata:\n{json.dumps(original_metadata, indent=2, ensure_ascii=False)}\n\n"
             f"Chapter Titles:\n{json.dumps(chapter_titles, indent=2, ensure_ascii=False)}"
-            f"{inheritance_context}"
         )
         
         response = self.client.generate(
@@ -862,14 +941,8 @@ class MetadataProcessor:
         )
         
         try:
-            # Clean response if it contains markdown code blocks
-            content = response.content.strip()
-            if content.startswith("```json"):
-                content = content[7:-3].strip()
-            elif content.startswith("```"):
-                content = content[3:-3].strip()
-
-            metadata_translated = json.loads(content)
+            # Response may be wrapped in markdown code blocks or prose
+            metadata_translated = _extract_json(response.content)
 
             # Add character names and glossary to metadata
             if name_registry:
@@ -884,8 +957,7 @@ class MetadataProcessor:
             # Save to language-specific metadata file (e.g., metadata_en.json, metadata_vn.json)
             output_filename = f"metadata_{self.target_language}.json"
             output_path = self.work_dir / output_filename
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(metadata_translated, f, indent=2, ensure_ascii=False)
+            _write_json(output_path, metadata_translated)
 
             logger.info(f"Metadata translated to {self.language_name} and saved to {output_path}")
 
@@ -904,12 +976,12 @@ class MetadataProcessor:
                 logger.info(f"Added {len(term_glossary)} terms to glossary")
 
             # Extract chapter translations to dict format
-            chapter_translations = {}
-            for ch in metadata_translated.get("chapters", []):
-                ch_id = ch.get("id", "")
-                ch_title = ch.get("title_en", ch.get(f"title_{self.target_language}", ""))
-                if ch_id and ch_title:
-                    chapter_translations[ch_id] = ch_title
+            title_key = f"title_{self.target_language}"
+            chapter_translations = {
+                ch_id: ch_title
+                for ch in metadata_translated.get("chapters", [])
+                if (ch_id := ch.get("id")) and (ch_title := ch.get("title_en") or ch.get(title_key))
+            }
 
             # Update manifest - PRESERVE v3 enhanced schema
             self._update_manifest_preserve_schema(
@@ -920,8 +992,7 @@ class MetadataProcessor:
                 glossary=term_glossary
             )
 
-            with open(self.manifest_path, 'w', encoding='utf-8') as f:
-                json.dump(self.manifest, f, indent=2, ensure_ascii=False)
+            _write_json(self.manifest_path, self.manifest)
 
         except Exception as e:
             logger.error(f"Failed to parse metadata response: {e}")
@@ -3,13 +3,39 @@ PDF Builder Agent - Main orchestrator for PDF generation using ReportLab.
 """
 
 import json
+import logging
 import re
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 from .config import get_output_dir, get_work_dir
 from .pdf_generator import PDFGenerator
 
+logger = logging.getLogger(__name__)
+
+# Inline markdown, applied in order: bold before italic so "**" is never
+# read as two italic markers, and each pass sees the tags of the previous one
+_INLINE_MARKDOWN_PASSES = (
+    (re.compile(r'\*\*(.+?)\*\*'), r'<b>\1</b>'),
+    (re.compile(r'__(.+?)__'), r'<b>\1</b>'),
+    (re.compile(r'\*(.+?)\*'), r'<i>\1</i>'),
+    (re.compile(r'_(.+?)_'), r'<i>\1</i>'),
+)
+
+# Image references: ![alt](path) and <img src="path" />
+_IMAGE_LINE_PREFIXES = ('![', '<img')
+_MD_IMAGE_RE = re.compile(r'!\[.*?\]\((.+?)\)')
+_HTML_IMAGE_SRC_RE = re.compile(r'src="(.+?)"')
+
+# Spread kuchi-e filenames carry a page range (e.g. "kuchie-002-003.jpg")
+_KUCHIE_HORIZONTAL_RE = re.compile(r'\d+-\d+')
+
 
 class PDFBuilderAgent:
     """Main PDF builder agent."""
@@ -25,28 +51,45 @@ class PDFBuilderAgent:
         skip_qc: bool = False
     ) -> bool:
         """Build PDF from manifest."""
-        print(f"\\n{'='*60}")
-        print(f"PDF BUILDER - Building: {volume_id}")
-        print(f"Theme: {theme}")
-        print(f"{'='*60}\\n")
+        logger.info("PDF BUILDER - Building: %s (theme: %s)", volume_id, theme)
         
         # Load manifest
         work_dir = self.work_base / volume_id
         manifest_path = work_dir / "manifest.json"
         
         if not manifest_path.exists():
-            print(f"[ERROR] Manifest not found: {manifest_path}")
+            logger.error("Manifest not found: %s", manifest_path)
             return False
         
-        with open(manifest_path, 'r', encoding='utf-8') as f:
-            manifest = json.load(f)
+        if ORJSON_AVAILABLE:
+            manifest = orjson.loads(manifest_path.read_bytes())
+        else:
+            # Binary read: json detects UTF-8 itself, skipping the text-decoding layer
+            with open(manifest_path, 'rb') as f:
+                manifest = json.load(f)
         
-        print(f"[STEP 1/5] Loading manifest...")
         metadata = manifest.get('metadata', {})
-        title = metadata.get('title', 'Untitled')
-        author = metadata.get('author', 'Unknown')
-        print(f"     Title: {title}")
-        print(f"     Author: {author}")
+        logger.info(
+            "[STEP 1/5] Loaded manifest: %s (author: %s)",
+            metadata.get('title', 'Untitled'), metadata.get('author', 'Unknown')
+        )
+        
+        # Step 2: Process chapters (theme-independent, shared by all themes)
+        chapters = self._process_chapters(work_dir, manifest)
+        
+        # Step 3: Process images
+        assets = manifest.get('assets', {})
+        cover_image = work_dir / "assets" / assets.get('cover', 'cover.jpg')
+        if not cover_image.exists():
+            cover_image = None
+        
+        # (relative path, is_horizontal) per kuchi-e, shared by every theme
+        kuchie_images = [
+            (f"assets/kuchie/{kuchie}", bool(_KUCHIE_HORIZONTAL_RE.search(kuchie)))
+            for kuchie in assets.get('kuchie', [])
+        ]
+        
+        logger.info("[STEP 3/5] Found %d kuchi-e", len(kuchie_images))
         
         # Determine which themes to build
         themes_to_build = ['light', 'dark'] if theme == 'both' else [theme]
@@ -56,14 +99,15 @@ class PDFBuilderAgent:
             success = self._build_single_pdf(
                 work_dir=work_dir,
                 manifest=manifest,
-                theme=current_theme
+                theme=current_theme,
+                chapters=chapters,
+                cover_image=cover_image,
+                kuchie_images=kuchie_images
             )
             if not success:
                 return False
         
-        print(f"\\n{'='*60}")
-        print("PDF BUILD COMPLETE")
-        print(f"{'='*60}\\n")
+        logger.info("PDF BUILD COMPLETE")
         
         return True
     
@@ -71,35 +115,18 @@ class PDFBuilderAgent:
         self,
         work_dir: Path,
         manifest: dict,
-        theme: str
+        theme: str,
+        chapters: List[dict],
+        cover_image: Optional[Path],
+        kuchie_images: List[Tuple[str, bool]]
     ) -> bool:
-        """Build a single PDF for specified theme."""
+        """Build a single PDF for specified theme from pre-processed content."""
         metadata = manifest.get('metadata', {})
         title = metadata.get('title', 'Untitled')
         author = metadata.get('author', 'Unknown')
         
-        print(f"\\n[Building {theme.upper()} mode PDF]\\n")
-        
-        # Step 2: Process chapters
-        print(f"[STEP 2/5] Processing chapters...")
-        chapters = self._process_chapters(work_dir, manifest)
-        print(f"     Processed: {len(chapters)} chapters")
-        
-        # Step 3: Process images
-        print(f"\\n[STEP 3/5] Processing images...")
-        assets = manifest.get('assets', {})
-        cover_image = work_dir / "assets" / assets.get('cover', 'cover.jpg')
-        
-        kuchie_images = []
-        for kuchie in assets.get('kuchie', []):
-            kuchie_path = f"assets/kuchie/{kuchie}"
-            is_horizontal = bool(re.search(r'\\d+-\\d+', kuchie))
-            kuchie_images.append((kuchie_path, is_horizontal))
-        
-        print(f"     Found: {len(kuchie_images)} kuchi-e")
-        
         # Step 4: Generate PDF
-        print(f"\\n[STEP 4/5] Generating PDF...")
+        logger.info("[STEP 4/5] Generating %s mode PDF...", theme.upper())
         output_dir = get_output_dir()
         output_dir.mkdir(parents=True, exist_ok=True)
         
@@ -112,7 +139,7 @@ class PDFBuilderAgent:
             output_path=pdf_path,
             title=title,
             author=author,
-            cover_image=cover_image if cover_image.exists() else None,
+            cover_image=cover_image,
             kuchie_images=kuchie_images,
             chapters=chapters,
             base_path=work_dir
@@ -120,11 +147,9 @@ class PDFBuilderAgent:
         
         if success:
             file_size = generator.get_file_size(pdf_path)
-            print(f"     [OK] PDF created: {pdf_filename}")
-            print(f"     Size: {file_size}")
-            print(f"     Path: {pdf_path}")
+            logger.info("PDF created: %s (%s) at %s", pdf_filename, file_size, pdf_path)
         else:
-            print(f"     [ERROR] PDF generation failed")
+            logger.error("PDF generation failed: %s", pdf_filename)
             return False
         
         return True
@@ -136,7 +161,11 @@ class PDFBuilderAgent:
     ) -> List[dict]:
         """Process markdown chapters."""
         chapters_data = manifest.get('chapters', [])
-        chapters_data = sorted(chapters_data, key=lambda ch: ch.get('toc_order', 999))
+        # Manifests written by the metadata processor are stored in TOC order;
+        # only older manifests still need sorting
+        toc_orders = [ch.get('toc_order', 999) for ch in chapters_data]
+        if any(a > b for a, b in zip(toc_orders, toc_orders[1:])):
+            chapters_data = sorted(chapters_data, key=lambda ch: ch.get('toc_order', 999))
         
         en_dir = work_dir / "EN"
         chapters = []
@@ -148,13 +177,11 @@ class PDFBuilderAgent:
             
             md_path = en_dir / source_file
             if not md_path.exists():
-                print(f"     [SKIP] Not found: {source_file}")
+                logger.warning("Skipping chapter, file not found: %s", source_file)
                 continue
             
             with open(md_path, 'r', encoding='utf-8') as f:
-                markdown_content = f.read()
-            
-            paragraphs = self._markdown_to_paragraphs(markdown_content)
+                paragraphs = self._markdown_to_paragraphs(f)
             
             chapters.append({
                 'id': chapter_id,
@@ -162,82 +189,87 @@ class PDFBuilderAgent:
                 'paragraphs': paragraphs,
                 'base_path': work_dir  # Add base path for image resolution
             })
-            
-            print(f"     [OK] {source_file}")
         
+        logger.info("[STEP 2/5] Processed %d/%d chapters", len(chapters), len(chapters_data))
         return chapters
     
-    def _markdown_to_paragraphs(self, markdown: str) -> List[str]:
-        """Convert markdown to list of paragraphs."""
-        # Remove title
-        lines = markdown.split('\n')
-        if lines and lines[0].startswith('#'):
-            lines = lines[1:]
-        
+    def _markdown_to_paragraphs(self, lines: Iterable[str]) -> List[Tuple[str, str]]:
+        """
+        Convert markdown lines (e.g. an open file) to list of paragraphs.
+
+        Each paragraph is a (kind, payload) tuple: ('text', inline HTML) or
+        ('image', image path).
+        """
         paragraphs = []
+        # One line buffer reused for every paragraph (cleared, not reallocated)
         current_para = []
+        add_line = current_para.append
         
-        for line in lines:
+        for line_no, line in enumerate(lines):
+            # Remove title
+            if line_no == 0 and line.startswith('#'):
+                continue
             line = line.strip()
             
             if not line:
                 if current_para:
                     para_text = ' '.join(current_para)
                     para_text = self._process_inline_markdown(para_text)
-                    paragraphs.append(para_text)
-                    current_para = []
+                    paragraphs.append(('text', para_text))
+                    current_para.clear()
                 continue
             
             # Check if line is an image
-            if line.startswith('![') or line.startswith('<img'):
+            if line.startswith(_IMAGE_LINE_PREFIXES):
                 # Finish current paragraph first
                 if current_para:
                     para_text = ' '.join(current_para)
                     para_text = self._process_inline_markdown(para_text)
-                    paragraphs.append(para_text)
-                    current_para = []
+                    paragraphs.append(('text', para_text))
+                    current_para.clear()
                 
-                # Extract image path and add as special marker
+                # Extract image path and add as image paragraph
                 img_path = self._extract_image_path(line)
                 if img_path:
-                    paragraphs.append(f'[IMAGE:{img_path}]')
+                    paragraphs.append(('image', img_path))
                 continue
             
             # Regular text line - add to current paragraph
-            current_para.append(line)
+            add_line(line)
         
         # Don't forget the final paragraph!
         if current_para:
             para_text = ' '.join(current_para)
             para_text = self._process_inline_markdown(para_text)
-            paragraphs.append(para_text)
+            paragraphs.append(('text', para_text))
         
         return paragraphs
     
     def _extract_image_path(self, line: str) -> Optional[str]:
         """Extract image path from markdown or HTML image tag."""
         # Try markdown format: ![alt](path)
-        match = re.search(r'!\[.*?\]\((.+?)\)', line)
+        match = _MD_IMAGE_RE.search(line)
         if match:
             return match.group(1)
         
         # Try HTML format: <img src="path" />
-        match = re.search(r'src="(.+?)"', line)
+        match = _HTML_IMAGE_SRC_RE.search(line)
         if match:
             return match.group(1)
         
         return None
     
     def _process_inline_markdown(self, text: str) -> str:
-        """Process inline markdown (bold, italic)."""
-        # Bold
-        text = re.sub(r'\*\*(.+?)\*\*', r'<b>\1</b>', text)
-        text = re.sub(r'__(.+?)__', r'<b>\1</b>', text)
-        
-        # Italic
-        text = re.sub(r'\*(.+?)\*', r'<i>\1</i>', text)
-        text = re.sub(r'_(.+?)_', r'<i>\1</i>', text)
-        
+        """
+        Process inline markdown (bold, italic).
+
+        Nested spans keep both tags: "*a **b** c*" -> "<i>a <b>b</b> c</i>".
+        """
+        # Most paragraphs carry no markup at all; skip the passes for them
+        if '*' not in text and '_' not in text:
+            return text
+        for pattern, repl in _INLINE_MARKDOWN_PASSES:
+            text = pattern.sub(repl, text)
         return text
 
 
@@ -264,6 +296,7 @@ if __name__ == "__main__":
     
     args = parser.parse_args()
     
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     agent = PDFBuilderAgent()
     success = agent.build_pdf(
         volume_id=args.volume_id,
@@ -17,6 +17,11 @@ FONT_SIZE = '11pt'
 LINE_HEIGHT = '1.6'
 TEXT_ALIGN = 'justify'
 
+# Images
+IMAGE_DPI = 300  # Illustrations are downsampled to this resolution at their draw size
+IMAGE_DOWNSAMPLE_THRESHOLD = 1.5  # Only resample sources this much larger than the target
+IMAGE_JPEG_QUALITY = 85
+
 # Paths
 def get_output_dir() -> Path:
     """Get OUTPUT directory path."""
@@ -25,3 +30,7 @@ def get_output_dir() -> Path:
 def get_work_dir() -> Path:
     """Get WORK directory path."""
     return Path(__file__).parent.parent.parent / "WORK"
+
+def get_image_cache_dir(work_dir: Path) -> Path:
+    """Get a volume's resized illustration cache (removed along with the volume)."""
+    return work_dir / ".context" / "pdf_images"
@@ -70,13 +70,11 @@ class HTMLBuilder:
         Returns:
             HTML string for TOC page
         """
-        toc_items = []
-        for ch in chapters:
-            title_escaped = html_module.escape(ch['title'])
-            ch_id = ch['id']
-            toc_items.append(f'    <li class="toc-item"><a href="#{ch_id}">{title_escaped}</a></li>')
-        
-        toc_html = '\n'.join(toc_items)
+        escape = html_module.escape
+        toc_html = '\n'.join(
+            f'    <li class="toc-item"><a href="#{ch["id"]}">{escape(ch["title"])}</a></li>'
+            for ch in chapters
+        )
         
         return f'''
 <div class="toc-page page-break">
@@ -2,27 +2,92 @@
 PDF Generator - ReportLab-based PDF creation.
 
 Pure Python implementation with no system dependencies.
+
+Paragraph layout spends most of its time in stringWidth; install
+reportlab[accel] (the _rl_accel C extension) and ReportLab switches to the
+native implementation automatically, falling back to pure Python otherwise.
 """
 
+import hashlib
+import logging
+import math
+import os
+import re
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, List
+from typing import Dict, Optional, List, Tuple
 from io import BytesIO
 
+from PIL import Image as PILImage
 from reportlab.lib.pagesizes import A5
 from reportlab.lib.units import mm
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.enums import TA_JUSTIFY, TA_CENTER
 from reportlab.platypus import (
     SimpleDocTemplate, Paragraph, Spacer, PageBreak,
-    Image as RLImage, KeepTogether
+    Image as RLImage, KeepTogether, NextPageTemplate
 )
+from reportlab.platypus.doctemplate import BaseDocTemplate, PageTemplate, Frame
 from reportlab.pdfgen import canvas
 from reportlab.lib.colors import black, HexColor
+from reportlab.lib.utils import ImageReader
+
+from .config import (
+    IMAGE_DPI, IMAGE_DOWNSAMPLE_THRESHOLD, IMAGE_JPEG_QUALITY,
+    get_image_cache_dir
+)
+
+logger = logging.getLogger(__name__)
+
+
+# A5 page geometry (points)
+_PAGE_WIDTH, _PAGE_HEIGHT = A5
+_MARGIN_X = 15*mm
+_MARGIN_Y = 20*mm
+_FRAME_WIDTH = _PAGE_WIDTH - 2*_MARGIN_X
+_FRAME_HEIGHT = _PAGE_HEIGHT - 2*_MARGIN_Y
+_KUCHIE_MAX_HEIGHT = _PAGE_HEIGHT - 60*mm
+_ILLUSTRATION_MAX_HEIGHT = _PAGE_HEIGHT - 50*mm  # Full page height minus margins
+_PAGE_CENTER_X = _PAGE_WIDTH / 2
+
+# EPUB-relative illustration prefixes mapped onto the volume's assets folder
+_EPUB_IMAGE_PREFIX_RE = re.compile(r'^\.\./(?:Images|image)/')
+# '<' that doesn't open/close a tag ReportLab's paragraph markup understands
+_UNSUPPORTED_TAG_RE = re.compile(
+    r'<(?!/?(?:a|b|br|em|font|i|link|span|strike|strong|sub|sup|super|u)\b)'
+)
+
+
+def _escape_unsupported_markup(text: str) -> str:
+    """Escape each raw '<' or unknown tag, leaving supported tags intact."""
+    return _UNSUPPORTED_TAG_RE.sub('&lt;', text)
+
+
+@lru_cache(maxsize=4096)
+def _parse_paragraph(text: str, style: ParagraphStyle):
+    """Run ReportLab's para-parser once per (text, style) pair."""
+    para = Paragraph(text, style)
+    return para.frags, para.style, para.bulletText
+
+
+def _make_paragraph(text: str, style: ParagraphStyle) -> Paragraph:
+    """
+    Create a Paragraph from cached parse fragments.
+    
+    Scene breaks, separators and repeated titles recur throughout a volume;
+    building from the cached frags skips re-tokenizing identical markup.
+    Parse errors are not cached and propagate as with Paragraph().
+    """
+    frags, parsed_style, bullet_text = _parse_paragraph(text, style)
+    return Paragraph(text, parsed_style, bulletText=bullet_text, frags=frags)
 
 
 class PDFGenerator:
     """Generates PDF using ReportLab."""
     
+    # Paragraph styles per theme, shared by every generator in the process
+    _styles_cache: Dict[str, Tuple[ParagraphStyle, ...]] = {}
+    
     def __init__(self, theme: str = 'light'):
         """
         Initialize PDF generator.
@@ -31,6 +96,15 @@ class PDFGenerator:
             theme: 'light' or 'dark'
         """
         self.theme = theme
+        # Raw file bytes and decoded image readers, shared by every flowable
+        # of the same path (illustrations often recur across chapters)
+        self._image_bytes: Dict[str, bytes] = {}
+        self._image_cache: Dict[str, ImageReader] = {}
+        # Decoded images keyed by content hash, so an illustration copied
+        # under another name decodes once per build
+        self._reader_pool: Dict[str, ImageReader] = {}
+        # Resized illustrations, under the volume being built (set per build)
+        self._resize_cache_dir: Optional[Path] = None
         self.setup_colors()
         self.setup_styles()
     
@@ -46,11 +120,20 @@ class PDFGenerator:
             self.heading_color = HexColor('#000000')
     
     def setup_styles(self):
-        """Setup paragraph styles."""
+        """Setup paragraph styles (built once per theme)."""
+        theme_styles = self._styles_cache.get(self.theme)
+        if theme_styles is None:
+            theme_styles = self._styles_cache[self.theme] = self._build_styles()
+        
+        (self.style_body, self.style_first, self.style_chapter,
+         self.style_toc_title, self.style_toc_item) = theme_styles
+    
+    def _build_styles(self) -> Tuple[ParagraphStyle, ...]:
+        """Build the paragraph styles for the current theme colors."""
         styles = getSampleStyleSheet()
         
         # Body text
-        self.style_body = ParagraphStyle(
+        style_body = ParagraphStyle(
             'CustomBody',
             parent=styles['Normal'],
             fontName='Times-Roman',
@@ -62,14 +145,14 @@ class PDFGenerator:
         )
         
         # First paragraph (no indent)
-        self.style_first = ParagraphStyle(
+        style_first = ParagraphStyle(
             'FirstPara',
-            parent=self.style_body,
+            parent=style_body,
             firstLineIndent=0,
         )
         
         # Chapter title
-        self.style_chapter = ParagraphStyle(
+        style_chapter = ParagraphStyle(
             'ChapterTitle',
             parent=styles['Heading1'],
             fontName='Times-Bold',
@@ -81,13 +164,13 @@ class PDFGenerator:
         )
         
         # TOC title
-        self.style_toc_title = ParagraphStyle(
+        style_toc_title = ParagraphStyle(
             'TOCTitle',
-            parent=self.style_chapter,
+            parent=style_chapter,
         )
         
         # TOC item
-        self.style_toc_item = ParagraphStyle(
+        style_toc_item = ParagraphStyle(
             'TOCItem',
             parent=styles['Normal'],
             fontName='Times-Roman',
@@ -97,6 +180,9 @@ class PDFGenerator:
             leftIndent=0,
             firstLineIndent=0,
         )
+        
+        return (style_body, style_first, style_chapter,
+                style_toc_title, style_toc_item)
     
     def generate_pdf(
         self,
@@ -123,25 +209,27 @@ class PDFGenerator:
         Returns:
             True if successful
         """
+        self._resize_cache_dir = get_image_cache_dir(base_path)
         try:
-            from reportlab.platypus.doctemplate import BaseDocTemplate, PageTemplate, Frame
-            
-            # Create document
+            # Create document. ReportLab writes the finished PDF to output_path
+            # in one write (no intermediate copy); page compression is pinned so
+            # a site-wide rl_config override can't bloat that buffer.
             doc = BaseDocTemplate(
                 str(output_path),
                 pagesize=A5,
                 title=title,
                 author=author,
+                pageCompression=1,
             )
             
             # Define page templates
             # Cover template (no margins)
-            cover_frame = Frame(0, 0, A5[0], A5[1], leftPadding=0, bottomPadding=0,
+            cover_frame = Frame(0, 0, _PAGE_WIDTH, _PAGE_HEIGHT, leftPadding=0, bottomPadding=0,
                               rightPadding=0, topPadding=0, id='cover_frame')
             cover_template = PageTemplate(id='Cover', frames=[cover_frame])
             
             # Normal template (with margins)
-            normal_frame = Frame(15*mm, 20*mm, A5[0]-30*mm, A5[1]-40*mm,
+            normal_frame = Frame(_MARGIN_X, _MARGIN_Y, _FRAME_WIDTH, _FRAME_HEIGHT,
                                leftPadding=0, bottomPadding=0,
                                rightPadding=0, topPadding=0, id='normal_frame')
             normal_template = PageTemplate(id='Normal', frames=[normal_frame],
@@ -154,12 +242,8 @@ class PDFGenerator:
             
             # Cover page
             if cover_image and cover_image.exists():
-                from reportlab.platypus import NextPageTemplate
                 story.append(NextPageTemplate('Cover'))
-                img = RLImage(str(cover_image))
-                img.drawWidth = A5[0]
-                img.drawHeight = A5[1]
-                story.append(img)
+                story.append(self._make_image(cover_image, _PAGE_WIDTH, _PAGE_HEIGHT))
                 story.append(PageBreak())
                 # Switch to normal template for rest of document
                 story.append(NextPageTemplate('Normal'))
@@ -168,27 +252,13 @@ class PDFGenerator:
             for img_path, is_horizontal in kuchie_images:
                 full_path = base_path / img_path
                 if full_path.exists():
-                    available_width = A5[0] - 30*mm
-                    available_height = A5[1] - 60*mm
-                    
-                    img = RLImage(str(full_path))
-                    aspect = img.imageWidth / img.imageHeight
-                    
-                    if is_horizontal:
-                        img.drawWidth = available_width
-                        img.drawHeight = available_width / aspect
-                        if img.drawHeight > available_height:
-                            img.drawHeight = available_height
-                            img.drawWidth = available_height * aspect
-                    else:
-                        img.drawHeight = available_height
-                        img.drawWidth = available_height * aspect
-                        if img.drawWidth > available_width:
-                            img.drawWidth = available_width
-                            img.drawHeight = available_width / aspect
+                    # Landscape and portrait spreads both fit the frame
+                    draw_width, draw_height = self._fit(
+                        *self._image_size(full_path), _FRAME_WIDTH, _KUCHIE_MAX_HEIGHT
+                    )
                     
                     story.append(Spacer(1, 20*mm))
-                    story.append(img)
+                    story.append(self._make_image(full_path, draw_width, draw_height))
                     story.append(PageBreak())
             
             # Table of contents
@@ -206,11 +276,131 @@ class PDFGenerator:
             
             return True
             
-        except Exception as e:
-            print(f"[ERROR] PDF generation failed: {e}")
-            import traceback
-            traceback.print_exc()
+        except Exception:
+            logger.exception("PDF generation failed")
             return False
+        
+        finally:
+            # Embedded images live in the written PDF now; don't carry the
+            # raw bytes or decoded images into the next book
+            self._image_bytes.clear()
+            self._image_cache.clear()
+            self._reader_pool.clear()
+    
+    def _get_image_bytes(self, image_path: Path) -> bytes:
+        """Return the file contents for a path, reading it from disk once."""
+        key = str(image_path)
+        data = self._image_bytes.get(key)
+        if data is None:
+            data = self._image_bytes[key] = Path(key).read_bytes()
+        return data
+    
+    def _get_image_reader(self, image_path: Path) -> ImageReader:
+        """Return the shared ImageReader for a path, decoding it on first use."""
+        key = str(image_path)
+        reader = self._image_cache.get(key)
+        if reader is None:
+            data = self._get_image_bytes(image_path)
+            digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+            pool = self._reader_pool
+            reader = pool.get(digest)
+            if reader is None:
+                reader = pool[digest] = ImageReader(BytesIO(data))
+            self._image_cache[key] = reader
+        return reader
+    
+    def _cached_resize(self, src_path: Path, target_width: int, target_height: int) -> Path:
+        """
+        Return a copy of src_path downsampled to fit the target pixel box.
+        
+        Resized files are kept in the volume's image cache directory keyed by
+        source path, target size and mtime, so rebuilds (light + dark,
+        retries) reuse them; writing a new copy removes the ones left behind
+        by earlier versions of the same source. Sources less than IMAGE_DOWNSAMPLE_THRESHOLD times the
+        box are returned unchanged; re-encoding them would cost quality for
+        little size gain.
+        """
+        if self._resize_cache_dir is None:
+            return src_path
+        stem = hashlib.blake2b(
+            f"{src_path}:{target_width}:{target_height}:{IMAGE_JPEG_QUALITY}".encode(),
+            digest_size=16
+        ).hexdigest()
+        key = f"{stem}-{src_path.stat().st_mtime_ns}"
+        cache_dir = self._resize_cache_dir
+        for suffix in ('.jpg', '.png'):
+            cached = cache_dir / f"{key}{suffix}"
+            if cached.exists():
+                return cached
+        
+        with PILImage.open(BytesIO(self._get_image_bytes(src_path))) as im:
+            if (im.width <= target_width * IMAGE_DOWNSAMPLE_THRESHOLD
+                    and im.height <= target_height * IMAGE_DOWNSAMPLE_THRESHOLD):
+                return src_path
+            
+            im.thumbnail((target_width, target_height), PILImage.LANCZOS)
+            # Keep transparency in PNG; everything else embeds as JPEG
+            if im.mode in ('RGBA', 'LA') or 'transparency' in im.info:
+                cached, fmt, options = cache_dir / f"{key}.png", 'PNG', {'optimize': True}
+            else:
+                if im.mode not in ('RGB', 'L'):
+                    im = im.convert('RGB')
+                cached, fmt, options = cache_dir / f"{key}.jpg", 'JPEG', {'quality': IMAGE_JPEG_QUALITY, 'optimize': True}
+            
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            # Write under a unique name first so concurrent builds never see a partial file
+            tmp_path = cache_dir / f"{key}.{os.getpid()}.tmp"
+            im.save(tmp_path, format=fmt, **options)
+            tmp_path.replace(cached)
+        
+        # Drop copies resized from earlier versions of this source
+        for stale in cache_dir.glob(f"{stem}-*"):
+            if stale != cached and stale.suffix != '.tmp':
+                stale.unlink(missing_ok=True)
+        return cached
+    
+    def _image_size(self, image_path: Path) -> Tuple[int, int]:
+        """Return (width, height) in pixels, parsing only the image header."""
+        with PILImage.open(BytesIO(self._get_image_bytes(image_path))) as im:
+            return im.size
+    
+    @staticmethod
+    def _fit(
+        image_width: float,
+        image_height: float,
+        available_width: float,
+        available_height: float
+    ) -> Tuple[float, float]:
+        """Scale (width, height) to fit the available box, keeping aspect ratio."""
+        scale = min(available_width / image_width, available_height / image_height)
+        return image_width * scale, image_height * scale
+    
+    def _make_image(
+        self,
+        image_path: Path,
+        width: Optional[float] = None,
+        height: Optional[float] = None
+    ) -> RLImage:
+        """
+        Create an image flowable backed by the shared reader for its path.
+        
+        Passing the draw size up front (computed from _image_size) means
+        layout never has to ask ReportLab for the image dimensions, and
+        lets oversize sources be swapped for a copy resized to IMAGE_DPI.
+        JPEGs are sized from their header and embedded by filename, so only
+        other formats need a decoded reader; ReportLab reuses the same PDF
+        XObject for repeated filenames/readers either way.
+        """
+        if width is not None and height is not None:
+            image_path = self._cached_resize(
+                image_path,
+                math.ceil(width / 72 * IMAGE_DPI),
+                math.ceil(height / 72 * IMAGE_DPI)
+            )
+        img = RLImage(str(image_path), width=width, height=height)
+        if '_img' not in img.__dict__:
+            img._img = self._get_image_reader(image_path)
+        return img
     
     def _page_template(self, canvas_obj, doc):
         """Page template for headers/footers."""
@@ -219,7 +409,7 @@ class PDFGenerator:
         # Set background color for dark mode
         if self.theme == 'dark':
             canvas_obj.setFillColor(self.bg_color)
-            canvas_obj.rect(0, 0, A5[0], A5[1], fill=1, stroke=0)
+            canvas_obj.rect(0, 0, _PAGE_WIDTH, _PAGE_HEIGHT, fill=1, stroke=0)
         
         # Page number (except first page)
         if doc.page > 1:
@@ -227,46 +417,24 @@ class PDFGenerator:
             canvas_obj.setFillColor(self.text_color)
             page_num = canvas_obj.getPageNumber()
             text = str(page_num)
-            canvas_obj.drawCentredString(A5[0]/2, 10*mm, text)
+            canvas_obj.drawCentredString(_PAGE_CENTER_X, 10*mm, text)
         
         canvas_obj.restoreState()
     
     def _create_cover_page(self, image_path: Path):
         """Create cover page with full-page image."""
         # Cover page should fill the entire page (no margins)
-        img = RLImage(str(image_path))
-        img.drawHeight = A5[1]
-        img.drawWidth = A5[0]
-        return img
+        return self._make_image(image_path, _PAGE_WIDTH, _PAGE_HEIGHT)
     
     def _create_image_page(self, image_path: Path, is_horizontal: bool):
         """Create kuchi-e image page."""
-        # Calculate available space (page size minus margins)
-        available_width = A5[0] - 30*mm
-        available_height = A5[1] - 60*mm
-        
-        # Create image and scale to fit
-        img = RLImage(str(image_path))
-        
-        # Calculate aspect ratio
-        aspect = img.imageWidth / img.imageHeight
-        
-        # Scale to fit available space
-        if is_horizontal:
-            # Landscape - fit to width
-            img.drawWidth = available_width
-            img.drawHeight = available_width / aspect
-            if img.drawHeight > available_height:
-                img.drawHeight = available_height
-                img.drawWidth = available_height * aspect
-        else:
-            # Portrait - fit to height
-            img.drawHeight = available_height
-            img.drawWidth = available_height * aspect
-            if img.drawWidth > available_width:
-                img.drawWidth = available_width
-                img.drawHeight = available_width / aspect
+        # Scale to fit the frame (landscape hits the width limit,
+        # portrait the height limit)
+        draw_width, draw_height = self._fit(
+            *self._image_size(image_path), _FRAME_WIDTH, _KUCHIE_MAX_HEIGHT
+        )
         
+        img = self._make_image(image_path, draw_width, draw_height)
         return KeepTogether([Spacer(1, 20*mm), img])
     
     def _create_toc(self, chapters: List[dict]):
@@ -275,101 +443,90 @@ class PDFGenerator:
         
         # Title
         elements.append(Spacer(1, 40*mm))
-        elements.append(Paragraph("Table of Contents", self.style_toc_title))
+        elements.append(_make_paragraph("Table of Contents", self.style_toc_title))
         elements.append(Spacer(1, 10*mm))
         
         # Chapters
         for ch in chapters:
             title = ch['title']
-            elements.append(Paragraph(title, self.style_toc_item))
+            elements.append(_make_paragraph(title, self.style_toc_item))
             elements.append(Spacer(1, 4*mm))
         
         return KeepTogether(elements)
     
     def _create_chapter(self, chapter: dict, is_first: bool = False):
-        """Create chapter content."""
-        elements = []
+        """
+        Create chapter content.
         
+        Args:
+            chapter: Chapter dict with 'title' and 'paragraphs'
+            is_first: Whether this is the first chapter
+        
+        Yields:
+            Flowables, consumed straight into the story
+        """
         # Chapter title
-        elements.append(Spacer(1, 40*mm))
-        elements.append(Paragraph(chapter['title'], self.style_chapter))
+        yield Spacer(1, 40*mm)
+        yield _make_paragraph(chapter['title'], self.style_chapter)
         
-        # Chapter content (list of paragraphs)
+        # Chapter content (list of (kind, payload) paragraphs)
         paragraphs = chapter.get('paragraphs', [])
         
-        for i, para_text in enumerate(paragraphs):
-            # Check if this is an image marker
-            if para_text.startswith('[IMAGE:'):
-                # Extract image path
-                img_path = para_text.replace('[IMAGE:', '').replace(']', '')
-
+        for i, (kind, para_text) in enumerate(paragraphs):
+            if kind == 'image':
                 # Normalize path (convert from EPUB format to actual file path)
-                if img_path.startswith('../Images/'):
-                    img_path = img_path.replace('../Images/', 'assets/illustrations/')
-                elif img_path.startswith('../image/'):
-                    img_path = img_path.replace('../image/', 'assets/illustrations/')
+                img_path = _EPUB_IMAGE_PREFIX_RE.sub('assets/illustrations/', para_text, count=1)
 
                 # Try to add the image on its own page
                 try:
-                    from pathlib import Path
                     # Get base path from chapter dict if available
                     base_path = chapter.get('base_path', Path('.'))
                     full_img_path = base_path / img_path
 
-                    if full_img_path.exists():
-                        # Page break before illustration
-                        elements.append(PageBreak())
-
-                        # Calculate size to fit full page (with margins)
-                        available_width = A5[0] - 30*mm
-                        available_height = A5[1] - 50*mm  # Full page height minus margins
-
-                        img = RLImage(str(full_img_path))
-                        aspect = img.imageWidth / img.imageHeight
-
-                        # Scale to fit available space while maintaining aspect ratio
-                        if aspect > (available_width / available_height):
-                            # Image is wider - fit to width
-                            img.drawWidth = available_width
-                            img.drawHeight = available_width / aspect
-                        else:
-                            # Image is taller - fit to height
-                            img.drawHeight = available_height
-                            img.drawWidth = available_height * aspect
+                    if not full_img_path.exists():
+                        continue
 
-                        # Center vertically on the page
-                        vertical_space = (available_height - img.drawHeight) / 2
-                        elements.append(Spacer(1, vertical_space))
-                        elements.append(img)
-
-                        # Page break after illustration to continue text on next page
-                        elements.append(PageBreak())
+                    # Scale to fit full page (with margins) while maintaining aspect ratio
+                    draw_width, draw_height = self._fit(
+                        *self._image_size(full_img_path), _FRAME_WIDTH, _ILLUSTRATION_MAX_HEIGHT
+                    )
+                    img = self._make_image(full_img_path, draw_width, draw_height)
                 except Exception as e:
-                    print(f"[WARNING] Failed to add illustration {img_path}: {e}")
+                    logger.warning("Failed to add illustration %s: %s", img_path, e)
+                    continue
+
+                # Illustration on its own page, centered vertically, then
+                # continue text on the next page
+                yield PageBreak()
+                yield Spacer(1, (_ILLUSTRATION_MAX_HEIGHT - draw_height) / 2)
+                yield img
+                yield PageBreak()
                 continue
             
             # Regular paragraph
             # First paragraph has no indent
             style = self.style_first if i == 0 else self.style_body
+            para_text = _escape_unsupported_markup(para_text)
             
             # Create paragraph with HTML support for bold/italic
             try:
-                para = Paragraph(para_text, style)
-                elements.append(para)
+                para = _make_paragraph(para_text, style)
             except Exception as e:
-                # Fallback to plain text if HTML parsing fails
-                print(f"[WARNING] Failed to parse paragraph: {e}")
-                elements.append(Paragraph(para_text.replace('<', '&lt;').replace('>', '&gt;'), style))
-        
-        return elements
+                # Fallback to plain text if HTML parsing still fails (bad nesting)
+                logger.warning("Failed to parse paragraph: %s", e)
+                para = Paragraph(para_text.replace('<', '&lt;').replace('>', '&gt;'), style)
+            yield para
     
     def get_file_size(self, pdf_path: Path) -> str:
         """Get human-readable file size."""
         size_bytes = pdf_path.stat().st_size
         
+        # Integer rounding to 0.1 KB / 0.01 MB (no float formatting)
         if size_bytes < 1024:
             return f"{size_bytes} B"
         elif size_bytes < 1024 * 1024:
-            return f"{size_bytes / 1024:.1f} KB"
+            whole, tenths = divmod((size_bytes * 10 + 512) >> 10, 10)
+            return f"{whole}.{tenths} KB"
         else:
-            return f"{size_bytes / (1024 * 1024):.2f} MB"
+            whole, hundredths = divmod((size_bytes * 100 + (1 << 19)) >> 20, 100)
+            return f"{whole}.{hundredths:02d} MB"
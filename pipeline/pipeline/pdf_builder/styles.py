@@ -2,8 +2,11 @@
 PDF Styles - CSS for light and dark modes.
 """
 
+from functools import lru_cache
+
 from .config import *
 
+@lru_cache(maxsize=1)
 def get_base_css() -> str:
     """Get base CSS that applies to both themes."""
     return f'''
@@ -236,6 +239,7 @@ h1, h2, h3 {
 }
 '''
 
+@lru_cache(maxsize=2)
 def get_css(theme: str = 'light') -> str:
     """
     Get complete CSS for specified theme.
@@ -244,7 +248,7 @@ def get_css(theme: str = 'light') -> str:
         theme: 'light' or 'dark'
         
     Returns:
-        Complete CSS string
+        Complete CSS string (cached per theme; config values are constants)
     """
     base = get_base_css()
     
@@ -7,13 +7,43 @@ during EPUB extraction. It uses context-aware detection to distinguish between:
 - Stray Chinese characters (isolated, no Japanese neighbors)
 """
 
+import importlib.util
+import os
 import re
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Tuple, Dict, Optional
 from dataclasses import dataclass
+from fnmatch import fnmatch
 
+from .file_cache import file_key, read_bytes, read_decoded
 
-@dataclass
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# numba takes a few hundred ms to import, so only probe for it here; the
+# scoring kernel imports and compiles it on first use (_score_kernel)
+NUMBA_AVAILABLE = NUMPY_AVAILABLE and importlib.util.find_spec('numba') is not None
+
+# CJK Unified Ideographs (U+4E00 to U+9FFF) and their UTF-8 lead bytes
+_CJK_RE = re.compile(r'[\u4E00-\u9FFF]')
+_CJK_LEAD_BYTES = (b'\xe4', b'\xe5', b'\xe6', b'\xe7', b'\xe8', b'\xe9')
+
+# Suspicion score weights, shared by _calculate_suspicion and the compiled
+# _score_candidates so the two paths cannot drift apart
+_W_CHINESE_ONLY = 0.4      # Known Chinese-only character
+_W_RARE = 0.25             # Not in the common Japanese kanji list
+_W_COMPOUND = 0.15         # Per side forming a known Chinese compound
+_W_NO_KANA = 0.3           # No kana on either side
+_W_ONE_SIDE_KANA = 0.15    # Kana on one side only
+_W_LATIN_NEIGHBOR = 0.1    # Per adjacent Latin/Vietnamese letter
+_MAX_SCORE = 1.0
+
+
+@dataclass(slots=True)
 class CJKArtifact:
     """Detected CJK artifact with context."""
     line_number: int
@@ -30,7 +60,7 @@ class CJKArtifactCleaner:
     
     # Common Japanese Kanji (JLPT N5-N1, newspaper frequency)
     # Top 2000+ most common kanji used in Japanese
-    COMMON_JAPANESE_KANJI = set("""
+    COMMON_JAPANESE_KANJI = frozenset("""
         一二三四五六七八九十百千万円年月日時分人大小中学生先
         校本書店国会社名語文字目手足口耳心体話言読書見聞食飲
         行来帰入出上下左右前後東西南北内外間近遠高安多少長新
@@ -67,7 +97,7 @@ class CJKArtifactCleaner:
     """.replace('\n', '').replace(' ', ''))
     
     # Known Chinese-only or rare characters that shouldn't appear in Japanese
-    CHINESE_ONLY_CHARS = set("""
+    CHINESE_ONLY_CHARS = frozenset("""
         爲這個們嗎呢啊吧喔哦唄咧啦哪誰係喺啲嘅嗰噉乜咁點樣邊
         冇未曾經緊住咗過喇啩囉啫嚟佢哋你妳您俺咱阮伲偌倆仨
     """.replace('\n', '').replace(' ', ''))
@@ -78,6 +108,14 @@ class CJKArtifactCleaner:
         '可以', '不能', '應該', '會不', '沒有', '已經', '正在', '將要',
     }
     
+    # Any compound's first character followed by any compound's second one;
+    # consumes a single character so overlapping pairs (為什麼) all match,
+    # and the literal set prefix lets the scan skip non-CJK text quickly
+    _COMPOUND_RE = re.compile(
+        '[' + ''.join(sorted({pair[0] for pair in CHINESE_COMPOUNDS})) + ']'
+        '(?=[' + ''.join(sorted({pair[1] for pair in CHINESE_COMPOUNDS})) + '])'
+    )
+    
     def __init__(self, strict_mode: bool = False, min_confidence: float = 0.7, 
                  context_window: int = 5):
         """
@@ -102,42 +140,146 @@ class CJKArtifactCleaner:
         Returns:
             List of detected artifacts
         """
+        if NUMBA_AVAILABLE:
+            return self._detect_artifacts_jit(text)
+        
         artifacts = []
-        lines = text.split('\n')
+        append = artifacts.append
+        window = self.context_window
+        min_confidence = self.min_confidence
+        calculate_suspicion = self._calculate_suspicion
         
-        for line_num, line in enumerate(lines, 1):
-            # Find all CJK Unified Ideographs (U+4E00 to U+9FFF)
-            for match in re.finditer(r'[\u4E00-\u9FFF]', line):
-                char = match.group()
-                pos = match.start()
-                
-                # Extract context
-                left_start = max(0, pos - self.context_window)
-                right_end = min(len(line), pos + self.context_window + 1)
-                
-                left_context = line[left_start:pos]
-                right_context = line[pos+1:right_end]
-                
-                # Calculate suspicion score
-                confidence, reason = self._calculate_suspicion(
-                    char, left_context, right_context
-                )
-                
-                if confidence >= self.min_confidence:
-                    artifacts.append(CJKArtifact(
-                        line_number=line_num,
-                        char=char,
-                        position=pos,
-                        left_context=left_context,
-                        right_context=right_context,
-                        confidence=confidence,
-                        reason=reason
-                    ))
+        candidates = self._find_candidates(text)
+        if not candidates:
+            return artifacts
+        
+        compound_starts = self._compound_starts(text)
+        
+        for idx, line_num, line_start, line_end, kana_neighbors in candidates:
+            char = text[idx]
+            
+            # Extract context (never crossing the line boundaries)
+            left_context = text[max(line_start, idx - window):idx]
+            right_context = text[idx + 1:min(line_end, idx + window + 1)]
+            
+            # Calculate suspicion score
+            confidence, reason = calculate_suspicion(
+                char, left_context, right_context, kana_neighbors,
+                (bool(left_context) and idx - 1 in compound_starts,
+                 bool(right_context) and idx in compound_starts)
+            )
+            
+            if confidence >= min_confidence:
+                append(CJKArtifact(
+                    line_number=line_num,
+                    char=char,
+                    position=idx - line_start,
+                    left_context=left_context,
+                    right_context=right_context,
+                    confidence=confidence,
+                    reason=reason
+                ))
         
         return artifacts
     
+    def _detect_artifacts_jit(self, text: str) -> List[CJKArtifact]:
+        """
+        detect_artifacts() with every candidate scored by the compiled
+        _score_candidates kernel; reason strings are only built for hits.
+        """
+        cp = np.frombuffer(text.encode('utf-32-le', 'surrogatepass'), dtype=np.uint32)
+        located = _locate_candidates(cp)
+        if located is None:
+            return []
+        hits, line_idx, line_starts, line_ends = located
+        
+        compound_mask = np.zeros(cp.size, dtype=np.bool_)
+        compound_mask[list(self._compound_starts(text))] = True
+        
+        window = self.context_window
+        scores, codes = _score_kernel()(
+            cp, hits, line_starts, line_ends, compound_mask, _class_array(), window
+        )
+        
+        artifacts = []
+        for k in np.flatnonzero(scores >= self.min_confidence).tolist():
+            idx = int(hits[k])
+            line_start = int(line_starts[k])
+            line_end = int(line_ends[k])
+            artifacts.append(CJKArtifact(
+                line_number=int(line_idx[k]) + 1,
+                char=text[idx],
+                position=idx - line_start,
+                left_context=text[max(line_start, idx - window):idx],
+                right_context=text[idx + 1:min(line_end, idx + window + 1)],
+                confidence=float(scores[k]),
+                reason=_decode_reasons(int(codes[k]), text, idx)
+            ))
+        return artifacts
+    
+    def _compound_starts(self, text: str) -> set:
+        """Offsets where a Chinese compound starts, from one scan of the text."""
+        compounds = self.CHINESE_COMPOUNDS
+        return {
+            start for start in (m.start() for m in self._COMPOUND_RE.finditer(text))
+            if text[start:start + 2] in compounds
+        }
+    
+    def _find_candidates(self, text: str) -> List[tuple]:
+        """
+        Locate every CJK ideograph in text.
+        
+        Args:
+            text: Text to scan
+            
+        Returns:
+            List of (offset, line_number, line_start, line_end, kana_neighbors)
+            tuples, where offsets index into text, line_end is the offset of
+            the terminating newline (or len(text)) and kana_neighbors is a
+            precomputed (has_left_kana, has_right_kana) pair or None
+        """
+        if NUMPY_AVAILABLE:
+            # One vectorized range test over the whole document; the unsigned
+            # subtraction wraps everything below U+4E00 out of range
+            cp = np.frombuffer(text.encode('utf-32-le', 'surrogatepass'), dtype=np.uint32)
+            located = _locate_candidates(cp)
+            if located is None:
+                return []
+            hits, line_idx, line_starts, line_ends = located
+            
+            # Kana inside each context window, from one prefix sum over the
+            # kana mask: count in [a, b) is kana_sum[b] - kana_sum[a]
+            window = self.context_window
+            kana_sum = np.concatenate(([0], np.cumsum((cp - 0x3040) <= (0x30FF - 0x3040))))
+            left_lo = np.maximum(line_starts, hits - window)
+            right_hi = np.minimum(line_ends, hits + window + 1)
+            has_left_kana = kana_sum[hits] > kana_sum[left_lo]
+            has_right_kana = kana_sum[right_hi] > kana_sum[hits + 1]
+            
+            return list(zip(
+                hits.tolist(),
+                (line_idx + 1).tolist(),
+                line_starts.tolist(),
+                line_ends.tolist(),
+                zip(has_left_kana.tolist(), has_right_kana.tolist()),
+            ))
+        
+        candidates = []
+        line_start = 0
+        for line_num, line in enumerate(text.split('\n'), 1):
+            line_end = line_start + len(line)
+            for match in _CJK_RE.finditer(line):
+                candidates.append(
+                    (line_start + match.start(), line_num, line_start, line_end, None)
+                )
+            line_start = line_end + 1
+        return candidates
+    
     def _calculate_suspicion(self, char: str, left_ctx: str, 
-                            right_ctx: str) -> Tuple[float, str]:
+                            right_ctx: str,
+                            kana_neighbors: Optional[Tuple[bool, bool]] = None,
+                            compound_pairs: Optional[Tuple[bool, bool]] = None
+                            ) -> Tuple[float, str]:
         """
         Calculate suspicion score for a CJK character.
         
@@ -145,6 +287,9 @@ class CJKArtifactCleaner:
             char: The character to evaluate
             left_ctx: Left context string
             right_ctx: Right context string
+            kana_neighbors: Precomputed (has_left_kana, has_right_kana), if known
+            compound_pairs: Precomputed (left_pair_is_compound,
+                right_pair_is_compound), if known
             
         Returns:
             Tuple of (confidence_score, reason_string)
@@ -152,66 +297,78 @@ class CJKArtifactCleaner:
         score = 0.0
         reasons = []
         
+        table = _class_table()
+        char_class = _char_class(char)
+        
         # Factor 1: Known Chinese-only character (HIGH PRIORITY)
-        if char in self.CHINESE_ONLY_CHARS:
-            score += 0.4
+        if char_class & _CHINESE_ONLY:
+            score += _W_CHINESE_ONLY
             reasons.append("Chinese-only char")
         
         # Factor 2: Not in common Japanese Kanji list (MEDIUM)
-        elif char not in self.COMMON_JAPANESE_KANJI:
-            score += 0.25
+        elif char_class & _RARE:
+            score += _W_RARE
             reasons.append("Rare in Japanese")
         
         # Factor 3: Check for Chinese compound patterns
-        if left_ctx and left_ctx[-1] + char in self.CHINESE_COMPOUNDS:
-            score += 0.15
+        if compound_pairs is not None:
+            left_compound, right_compound = compound_pairs
+        else:
+            left_compound = bool(left_ctx) and left_ctx[-1] + char in self.CHINESE_COMPOUNDS
+            right_compound = bool(right_ctx) and char + right_ctx[0] in self.CHINESE_COMPOUNDS
+        
+        if left_compound:
+            score += _W_COMPOUND
             reasons.append(f"Chinese compound: {left_ctx[-1]}{char}")
-        if right_ctx and char + right_ctx[0] in self.CHINESE_COMPOUNDS:
-            score += 0.15
+        if right_compound:
+            score += _W_COMPOUND
             reasons.append(f"Chinese compound: {char}{right_ctx[0]}")
         
         # Factor 4: No Japanese kana neighbors (CRITICAL)
-        has_left_kana = any(self._is_japanese_kana(c) for c in left_ctx)
-        has_right_kana = any(self._is_japanese_kana(c) for c in right_ctx)
+        if kana_neighbors is not None:
+            has_left_kana, has_right_kana = kana_neighbors
+        else:
+            has_left_kana = any(
+                table[o] & _KANA for o in map(ord, left_ctx) if o < _TABLE_SIZE
+            )
+            has_right_kana = any(
+                table[o] & _KANA for o in map(ord, right_ctx) if o < _TABLE_SIZE
+            )
         
         if not has_left_kana and not has_right_kana:
-            score += 0.3
+            score += _W_NO_KANA
             reasons.append("No kana neighbors")
         elif not has_left_kana:
-            score += 0.15
+            score += _W_ONE_SIDE_KANA
             reasons.append("No left kana")
         elif not has_right_kana:
-            score += 0.15
+            score += _W_ONE_SIDE_KANA
             reasons.append("No right kana")
         
         # Factor 5: Surrounded by Latin/Vietnamese characters (SUSPICIOUS)
-        if left_ctx and self._is_latin_or_vietnamese(left_ctx[-1]):
-            score += 0.1
+        if left_ctx and _char_class(left_ctx[-1]) & _LATIN_VN:
+            score += _W_LATIN_NEIGHBOR
             reasons.append("Left: Latin/Vietnamese")
-        if right_ctx and self._is_latin_or_vietnamese(right_ctx[0]):
-            score += 0.1
+        if right_ctx and _char_class(right_ctx[0]) & _LATIN_VN:
+            score += _W_LATIN_NEIGHBOR
             reasons.append("Right: Latin/Vietnamese")
         
         reason = "; ".join(reasons) if reasons else "OK"
-        return min(score, 1.0), reason
+        return min(score, _MAX_SCORE), reason
     
     def _is_japanese_kana(self, char: str) -> bool:
         """Check if character is hiragana or katakana."""
         if not char:
             return False
-        code = ord(char)
         # Hiragana: U+3040–U+309F, Katakana: U+30A0–U+30FF
-        return (0x3040 <= code <= 0x309F) or (0x30A0 <= code <= 0x30FF)
+        return bool(_char_class(char) & _KANA)
     
     def _is_latin_or_vietnamese(self, char: str) -> bool:
         """Check if character is Latin alphabet or Vietnamese."""
         if not char:
             return False
-        code = ord(char)
         # Basic Latin + Latin-1 Supplement + Latin Extended-A/B (for Vietnamese)
-        return (0x0041 <= code <= 0x007A) or \
-               (0x00C0 <= code <= 0x024F) or \
-               char in 'ăâêôơưđĂÂÊÔƠƯĐ'
+        return bool(_char_class(char) & _LATIN_VN)
     
     def clean_file(self, filepath: Path) -> Dict[str, any]:
         """
@@ -223,28 +380,40 @@ class CJKArtifactCleaner:
         Returns:
             Dictionary with statistics and results
         """
-        if not filepath.exists():
+        # Read file (one stat for the cache key doubles as the existence check)
+        try:
+            key = file_key(filepath)
+        except FileNotFoundError:
             return {
                 'file': str(filepath),
                 'error': 'File not found',
                 'artifacts': [],
                 'modified': False
             }
-        
-        # Read file
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Detect artifacts
-        artifacts = self.detect_artifacts(content)
+        raw = read_bytes(*key)
         
         result = {
             'file': filepath.name,
-            'artifacts': len(artifacts),
+            'artifacts': 0,
             'modified': False,
             'details': []
         }
         
+        # U+4E00-U+9FFF all encode with a UTF-8 lead byte of E4-E9; without
+        # one there is nothing to detect, so skip decoding entirely
+        if not any(lead in raw for lead in _CJK_LEAD_BYTES):
+            return result
+        
+        content = read_decoded(*key)
+        if '\r' in content:
+            # Universal newlines, as a text-mode read would give, so CRLF
+            # chapters don't leak '\r' into line splits and contexts
+            content = content.replace('\r\n', '\n').replace('\r', '\n')
+        
+        # Detect artifacts
+        artifacts = self.detect_artifacts(content)
+        result['artifacts'] = len(artifacts)
+        
         if not artifacts:
             return result
         
@@ -262,28 +431,62 @@ class CJKArtifactCleaner:
         
         # Auto-remove if strict mode
         if self.strict_mode and artifacts:
-            cleaned_content = content
-            # Remove artifacts (sort by position descending to maintain indices)
-            lines = cleaned_content.split('\n')
-            
-            for artifact in sorted(artifacts, key=lambda a: (a.line_number, a.position), 
-                                  reverse=True):
-                line_idx = artifact.line_number - 1
-                if line_idx < len(lines):
-                    line = lines[line_idx]
-                    # Remove the character
-                    lines[line_idx] = line[:artifact.position] + line[artifact.position+1:]
-            
-            cleaned_content = '\n'.join(lines)
+            cleaned = self._remove_artifacts(content, artifacts)
+            if os.linesep != '\n':
+                # Text-mode write newlines, as before
+                cleaned = cleaned.replace('\n', os.linesep)
+            cleaned = cleaned.encode('utf-8')
             
-            # Write back
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(cleaned_content)
-            
-            result['modified'] = True
+            # Write back, unless nothing actually changed on disk
+            if cleaned != raw:
+                filepath.write_bytes(cleaned)
+                result['modified'] = True
         
         return result
     
+    def _remove_artifacts(self, content: str, artifacts: List[CJKArtifact]) -> str:
+        """
+        Return content with every artifact character removed.
+        
+        Args:
+            content: Text the artifacts were detected in
+            artifacts: Artifacts from detect_artifacts(content)
+            
+        Returns:
+            Cleaned text
+        """
+        if NUMPY_AVAILABLE:
+            # Map (line, position) to flat offsets, then drop them all with
+            # one boolean mask over the codepoint array
+            cp = np.frombuffer(content.encode('utf-32-le', 'surrogatepass'), dtype=np.uint32)
+            line_starts = np.concatenate(([0], np.flatnonzero(cp == 0x0A) + 1))
+            offsets = [int(line_starts[a.line_number - 1]) + a.position for a in artifacts]
+            keep = np.ones(cp.size, dtype=bool)
+            keep[offsets] = False
+            return cp[keep].tobytes().decode('utf-32-le', 'surrogatepass')
+        
+        # Line start offsets, only as far as the last affected line
+        last_line = max((a.line_number for a in artifacts), default=0)
+        line_starts = [0]
+        pos = content.find('\n')
+        while pos != -1 and len(line_starts) < last_line:
+            line_starts.append(pos + 1)
+            pos = content.find('\n', pos + 1)
+        
+        drop = sorted({
+            line_starts[a.line_number - 1] + a.position
+            for a in artifacts if a.line_number <= len(line_starts)
+        })
+        
+        # Copy the spans between dropped characters in one pass
+        out = []
+        prev = 0
+        for offset in drop:
+            out.append(content[prev:offset])
+            prev = offset + 1
+        out.append(content[prev:])
+        return ''.join(out)
+    
     def clean_directory(self, directory: Path, pattern: str = "CHAPTER_*.md") -> Dict[str, any]:
         """
         Clean all matching files in a directory.
@@ -295,7 +498,15 @@ class CJKArtifactCleaner:
         Returns:
             Summary statistics
         """
-        files = sorted(directory.glob(pattern))
+        # One scandir pass; DirEntry.is_file() uses the cached entry type
+        try:
+            with os.scandir(directory) as entries:
+                files = sorted(
+                    entry.path for entry in entries
+                    if fnmatch(entry.name, pattern) and entry.is_file()
+                )
+        except (FileNotFoundError, NotADirectoryError):
+            files = []
         
         results = {
             'directory': str(directory),
@@ -307,7 +518,7 @@ class CJKArtifactCleaner:
         }
         
         for filepath in files:
-            result = self.clean_file(filepath)
+            result = self.clean_file(Path(filepath))
             results['files_processed'] += 1
             
             if result.get('artifacts', 0) > 0:
@@ -358,6 +569,189 @@ class CJKArtifactCleaner:
         return global_results
 
 
+# Per-codepoint class flags for the Basic Multilingual Plane
+_CHINESE_ONLY = 1   # Known Chinese-only character
+_RARE = 2           # CJK ideograph outside the common Japanese Kanji list
+_KANA = 4           # Hiragana / Katakana
+_LATIN_VN = 8       # Latin letters, including Vietnamese diacritics
+_TABLE_SIZE = 0x10000
+
+
+# CJK Unified Ideographs block
+_CJK_FIRST = 0x4E00
+_CJK_END = 0xA000
+
+
+@lru_cache(maxsize=1)
+def _class_table() -> bytes:
+    """
+    The 64 KiB codepoint -> class flags lookup table, built on first use so
+    importing the post_processor package for FormatNormalizer alone stays cheap.
+    """
+    table = bytearray(_TABLE_SIZE)
+    for code in range(_CJK_FIRST, _CJK_END):
+        table[code] = _RARE
+    for char in CJKArtifactCleaner.COMMON_JAPANESE_KANJI:
+        table[ord(char)] &= ~_RARE
+    for char in CJKArtifactCleaner.CHINESE_ONLY_CHARS:
+        table[ord(char)] |= _CHINESE_ONLY
+    for code in range(0x3040, 0x3100):
+        table[code] |= _KANA
+    for lo, hi in ((0x0041, 0x007A), (0x00C0, 0x024F)):
+        for code in range(lo, hi + 1):
+            table[code] |= _LATIN_VN
+    for char in 'ăâêôơưđĂÂÊÔƠƯĐ':
+        table[ord(char)] |= _LATIN_VN
+    return bytes(table)
+
+
+def _char_class(char: str) -> int:
+    """Class flags for a single character (0 outside the BMP)."""
+    code = ord(char)
+    return _class_table()[code] if code < _TABLE_SIZE else 0
+
+
+def _locate_candidates(cp):
+    """
+    Vectorized CJK ideograph scan over a codepoint array.
+    
+    Returns:
+        (hits, line_idx, line_starts, line_ends) int64 arrays, where
+        line_idx is 0-based, or None when there are no ideographs
+    """
+    # The unsigned subtraction wraps everything below U+4E00 out of range
+    hits = np.flatnonzero((cp - 0x4E00) <= (0x9FFF - 0x4E00))
+    if not hits.size:
+        return None
+    newlines = np.flatnonzero(cp == 0x0A)
+    # Newlines before each hit give its 0-based line index
+    line_idx = np.searchsorted(newlines, hits)
+    bounds = np.concatenate(([-1], newlines, [cp.size]))
+    return hits, line_idx, bounds[line_idx] + 1, bounds[line_idx + 1]
+
+
+# Reason bits set by _score_candidates, in _calculate_suspicion's order
+_R_CHINESE_ONLY = 1
+_R_RARE = 2
+_R_COMPOUND_LEFT = 4
+_R_COMPOUND_RIGHT = 8
+_R_NO_KANA = 16
+_R_NO_LEFT_KANA = 32
+_R_NO_RIGHT_KANA = 64
+_R_LEFT_LATIN = 128
+_R_RIGHT_LATIN = 256
+
+
+def _decode_reasons(code: int, text: str, idx: int) -> str:
+    """Rebuild the _calculate_suspicion reason string from a reason bitfield."""
+    reasons = []
+    if code & _R_CHINESE_ONLY:
+        reasons.append("Chinese-only char")
+    if code & _R_RARE:
+        reasons.append("Rare in Japanese")
+    if code & _R_COMPOUND_LEFT:
+        reasons.append(f"Chinese compound: {text[idx - 1:idx + 1]}")
+    if code & _R_COMPOUND_RIGHT:
+        reasons.append(f"Chinese compound: {text[idx:idx + 2]}")
+    if code & _R_NO_KANA:
+        reasons.append("No kana neighbors")
+    if code & _R_NO_LEFT_KANA:
+        reasons.append("No left kana")
+    if code & _R_NO_RIGHT_KANA:
+        reasons.append("No right kana")
+    if code & _R_LEFT_LATIN:
+        reasons.append("Left: Latin/Vietnamese")
+    if code & _R_RIGHT_LATIN:
+        reasons.append("Right: Latin/Vietnamese")
+    return "; ".join(reasons) if reasons else "OK"
+
+
+@lru_cache(maxsize=1)
+def _class_array():
+    """_class_table() as a uint8 ndarray, for the compiled kernel."""
+    return np.frombuffer(_class_table(), dtype=np.uint8)
+
+
+@lru_cache(maxsize=1)
+def _score_kernel():
+    """_score_candidates compiled with numba, imported here on first use."""
+    from numba import njit
+    return njit(cache=True)(_score_candidates)
+
+
+def _score_candidates(cp, hits, line_starts, line_ends, compound_mask, table, window):
+    """
+    _calculate_suspicion over every candidate, in numba-compilable form
+    (see _score_kernel).
+    
+    Scores are accumulated in the same order as the Python version, so
+    they match it exactly. Returns (scores, reason_codes) arrays.
+    """
+    n = hits.size
+    size = table.size
+    scores = np.empty(n, dtype=np.float64)
+    codes = np.zeros(n, dtype=np.int32)
+    for k in range(n):
+        i = hits[k]
+        lo = max(line_starts[k], i - window)
+        hi = min(line_ends[k], i + window + 1)
+        score = 0.0
+        code = 0
+        
+        char_class = table[cp[i]]
+        if char_class & _CHINESE_ONLY:
+            score += _W_CHINESE_ONLY
+            code |= _R_CHINESE_ONLY
+        elif char_class & _RARE:
+            score += _W_RARE
+            code |= _R_RARE
+        
+        if lo < i and compound_mask[i - 1]:
+            score += _W_COMPOUND
+            code |= _R_COMPOUND_LEFT
+        if i + 1 < hi and compound_mask[i]:
+            score += _W_COMPOUND
+            code |= _R_COMPOUND_RIGHT
+        
+        has_left_kana = False
+        for j in range(lo, i):
+            c = cp[j]
+            if c < size and table[c] & _KANA:
+                has_left_kana = True
+                break
+        has_right_kana = False
+        for j in range(i + 1, hi):
+            c = cp[j]
+            if c < size and table[c] & _KANA:
+                has_right_kana = True
+                break
+        
+        if not has_left_kana and not has_right_kana:
+            score += _W_NO_KANA
+            code |= _R_NO_KANA
+        elif not has_left_kana:
+            score += _W_ONE_SIDE_KANA
+            code |= _R_NO_LEFT_KANA
+        elif not has_right_kana:
+            score += _W_ONE_SIDE_KANA
+            code |= _R_NO_RIGHT_KANA
+        
+        if lo < i:
+            c = cp[i - 1]
+            if c < size and table[c] & _LATIN_VN:
+                score += _W_LATIN_NEIGHBOR
+                code |= _R_LEFT_LATIN
+        if i + 1 < hi:
+            c = cp[i + 1]
+            if c < size and table[c] & _LATIN_VN:
+                score += _W_LATIN_NEIGHBOR
+                code |= _R_RIGHT_LATIN
+        
+        scores[k] = min(score, _MAX_SCORE)
+        codes[k] = code
+    return scores, codes
+
+
 def format_results_report(results: Dict[str, any]) -> str:
     """
     Format results dictionary into a readable report.
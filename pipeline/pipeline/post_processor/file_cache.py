@@ -0,0 +1,44 @@
+"""
+File Cache - Shared reads for the post-processing passes.
+
+Format normalization and CJK artifact detection run back to back over the
+same chapter files. Reads are memoized on (path, mtime_ns, size), so a file
+left untouched by one pass is neither re-read nor re-decoded by the next,
+while any rewrite changes the key and invalidates the entry.
+"""
+
+from functools import lru_cache
+from pathlib import Path
+from typing import Tuple
+
+# Roughly a volume's chapters across all target languages
+CACHE_SIZE = 256
+
+
+def file_key(path: Path) -> Tuple[str, int, int]:
+    """
+    Cache key for a file's current contents.
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+    """
+    st = path.stat()
+    return str(path), st.st_mtime_ns, st.st_size
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def read_bytes(path_str: str, mtime_ns: int, size: int) -> bytes:
+    """Raw file contents for a file_key() key."""
+    return Path(path_str).read_bytes()
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def read_decoded(path_str: str, mtime_ns: int, size: int) -> str:
+    """UTF-8 decoded file contents for a file_key() key."""
+    return read_bytes(path_str, mtime_ns, size).decode('utf-8')
+
+
+def clear_cache() -> None:
+    """Drop every memoized read, e.g. once a volume's passes are done."""
+    read_bytes.cache_clear()
+    read_decoded.cache_clear()
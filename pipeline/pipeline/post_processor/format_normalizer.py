@@ -7,10 +7,13 @@ that may leak through translation to international standards.
 Runs after Phase 2 translation, works on all configured target languages.
 """
 
+import os
 import re
 from pathlib import Path
 from typing import Dict, List, Tuple
 
+from .file_cache import file_key, read_bytes, read_decoded
+
 
 class FormatNormalizer:
     """
@@ -63,6 +66,39 @@ class FormatNormalizer:
                        Default False to preserve intentional full-width usage.
         """
         self.aggressive = aggressive
+        
+        # Single-character substitutions. str.count/str.replace scan with
+        # memchr, which beats a per-character str.translate or Counter pass
+        # on chapter-sized text, so each is only replaced when present.
+        self._char_map = {
+            self.JAPANESE_QUOTES_OPEN: self.STANDARD_QUOTE,
+            self.JAPANESE_QUOTES_CLOSE: self.STANDARD_QUOTE,
+            self.JAPANESE_ANGLE_QUOTES_OPEN: self.STANDARD_QUOTE,
+            self.JAPANESE_ANGLE_QUOTES_CLOSE: self.STANDARD_QUOTE,
+            self.JAPANESE_SPACE: self.STANDARD_SPACE,
+        }
+        if aggressive:
+            self._char_map.update(self.FULLWIDTH_PUNCTUATION)
+        
+        # Full-width ASCII mirrors all encode as EF BC xx / EF BD xx, so one
+        # check of the raw bytes for those prefixes can rule out every one
+        # of them; _base_chars is the character set to count in that case
+        self._fullwidth = frozenset(self.FULLWIDTH_PUNCTUATION) - {self.JAPANESE_SPACE}
+        self._fullwidth_prefixes = tuple(sorted(
+            {char.encode('utf-8')[:2] for char in self._fullwidth}
+        )) if aggressive else ()
+        self._base_chars = tuple(char for char in self._char_map if char not in self._fullwidth)
+        
+        # Multi-character ellipsis forms (double ellipsis first)
+        self._ellipsis_forms = (self.JAPANESE_DOUBLE_ELLIPSIS, *self.JAPANESE_ELLIPSIS_VARIANTS)
+        
+        # Byte tokens, one of which must occur in the raw file for any
+        # pattern to match: ASCII patterns as-is, others by UTF-8 lead byte
+        patterns = (*self._ellipsis_forms, *self._char_map)
+        self._prefilter = tuple(sorted(
+            {p.encode('utf-8') for p in patterns if p.isascii()}
+            | {p.encode('utf-8')[:1] for p in patterns if not p.isascii()}
+        ))
         self.stats = {
             'files_processed': 0,
             'files_modified': 0,
@@ -83,14 +119,14 @@ class FormatNormalizer:
         Returns:
             Tuple of (was_modified, change_counts)
         """
-        if not file_path.exists() or file_path.suffix != '.md':
+        if file_path.suffix != '.md':
             return False, {}
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            key = file_key(file_path)
+            data = read_bytes(*key)
             
-            original_content = content
+            modified = False
             local_stats = {
                 'japanese_quotes': 0,
                 'japanese_angle_quotes': 0,
@@ -99,71 +135,69 @@ class FormatNormalizer:
                 'japanese_spaces': 0
             }
             
-            # 1. Convert Japanese quotation marks 「」
-            quote_open_count = content.count(self.JAPANESE_QUOTES_OPEN)
-            quote_close_count = content.count(self.JAPANESE_QUOTES_CLOSE)
-            if quote_open_count > 0 or quote_close_count > 0:
-                content = content.replace(self.JAPANESE_QUOTES_OPEN, self.STANDARD_QUOTE)
-                content = content.replace(self.JAPANESE_QUOTES_CLOSE, self.STANDARD_QUOTE)
-                local_stats['japanese_quotes'] = quote_open_count + quote_close_count
-            
-            # 2. Convert Japanese angle quotation marks 《》
-            angle_open_count = content.count(self.JAPANESE_ANGLE_QUOTES_OPEN)
-            angle_close_count = content.count(self.JAPANESE_ANGLE_QUOTES_CLOSE)
-            if angle_open_count > 0 or angle_close_count > 0:
-                content = content.replace(self.JAPANESE_ANGLE_QUOTES_OPEN, self.STANDARD_QUOTE)
-                content = content.replace(self.JAPANESE_ANGLE_QUOTES_CLOSE, self.STANDARD_QUOTE)
-                local_stats['japanese_angle_quotes'] = angle_open_count + angle_close_count
+            # Nothing to normalize (e.g. plain ASCII output): skip decoding
+            if not any(token in data for token in self._prefilter):
+                return False, local_stats
             
-            # 3. Convert double ellipsis to single
-            ellipsis_count = content.count(self.JAPANESE_DOUBLE_ELLIPSIS)
-            if ellipsis_count > 0:
-                content = content.replace(self.JAPANESE_DOUBLE_ELLIPSIS, self.STANDARD_ELLIPSIS)
-                local_stats['double_ellipsis'] = ellipsis_count
+            content = read_decoded(*key)
+            if '\r' in content:
+                # Universal newlines, as a text-mode read would give
+                content = content.replace('\r\n', '\n').replace('\r', '\n')
             
-            # 4. Convert other ellipsis variants
-            for variant in self.JAPANESE_ELLIPSIS_VARIANTS:
-                if variant in content:
-                    content = content.replace(variant, self.STANDARD_ELLIPSIS)
+            # 1. Collapse double ellipsis and ellipsis variants to a single …
+            #    (before the character pass, so ．．． isn't first turned into ...)
+            local_stats['double_ellipsis'] = content.count(self.JAPANESE_DOUBLE_ELLIPSIS)
+            for form in self._ellipsis_forms:
+                if form in content:
+                    content = content.replace(form, self.STANDARD_ELLIPSIS)
+                    modified = True
             
-            # 5. Convert Japanese full-width spaces
-            space_count = content.count(self.JAPANESE_SPACE)
-            if space_count > 0:
-                # Preserve in code blocks and between CJK characters
-                content = self._normalize_spaces(content)
-                local_stats['japanese_spaces'] = space_count
-            
-            # 6. Optional: Convert full-width punctuation (if aggressive mode)
+            # 2. Count each mapped character once; the same counts drive the
+            #    stats and decide which replacements are needed at all
+            chars = self._char_map
+            if self._fullwidth_prefixes and not any(
+                prefix in data for prefix in self._fullwidth_prefixes
+            ):
+                chars = self._base_chars
+            counts = {char: content.count(char) for char in chars}
+            local_stats['japanese_quotes'] = (
+                counts[self.JAPANESE_QUOTES_OPEN] + counts[self.JAPANESE_QUOTES_CLOSE]
+            )
+            local_stats['japanese_angle_quotes'] = (
+                counts[self.JAPANESE_ANGLE_QUOTES_OPEN] + counts[self.JAPANESE_ANGLE_QUOTES_CLOSE]
+            )
+            local_stats['japanese_spaces'] = counts[self.JAPANESE_SPACE]
             if self.aggressive:
-                punct_count = 0
-                for fw, hw in self.FULLWIDTH_PUNCTUATION.items():
-                    if fw in content:
-                        punct_count += content.count(fw)
-                        content = content.replace(fw, hw)
-                local_stats['fullwidth_punct'] = punct_count
+                local_stats['fullwidth_punct'] = sum(
+                    count for char, count in counts.items() if char in self._fullwidth
+                )
+            
+            # 3. Convert quotes 「」《》, full-width spaces and (aggressive mode)
+            #    full-width punctuation that is actually present
+            for char, count in counts.items():
+                if count:
+                    content = content.replace(char, self._char_map[char])
+                    modified = True
             
-            # Write back if modified
-            if content != original_content:
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(content)
-                return True, local_stats
+            # Write back only if the bytes actually differ; the comparison
+            # stops at the length check for any real substitution
+            if modified:
+                if os.linesep != '\n':
+                    # Text-mode write newlines, as before
+                    content = content.replace('\n', os.linesep)
+                new_data = content.encode('utf-8')
+                if new_data != data:
+                    file_path.write_bytes(new_data)
+                    return True, local_stats
             
             return False, local_stats
             
+        except FileNotFoundError:
+            return False, {}
         except Exception as e:
             print(f"     [WARNING] Error processing {file_path.name}: {e}")
             return False, {}
     
-    def _normalize_spaces(self, content: str) -> str:
-        """
-        Normalize Japanese full-width spaces intelligently.
-        
-        Preserves spaces between CJK characters where they might be intentional,
-        but converts to regular spaces in Latin text context.
-        """
-        # For now, simple replacement - can be made smarter later
-        return content.replace(self.JAPANESE_SPACE, self.STANDARD_SPACE)
-    
     def normalize_directory(self, directory: Path, pattern: str = "CHAPTER_*.md") -> Dict[str, int]:
         """
         Normalize all matching files in a directory.
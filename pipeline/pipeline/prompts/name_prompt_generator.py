@@ -12,12 +12,345 @@ Usage:
 """
 
 from pathlib import Path
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Tuple
 from dataclasses import dataclass
+from functools import lru_cache
 import re
+import unicodedata
+
+
+# Basic hiragana to romaji mapping
+_HIRA_ROMAJI: Dict[str, str] = {
+    'あ': 'a', 'い': 'i', 'う': 'u', 'え': 'e', 'お': 'o',
+    'か': 'ka', 'き': 'ki', 'く': 'ku', 'け': 'ke', 'こ': 'ko',
+    'さ': 'sa', 'し': 'shi', 'す': 'su', 'せ': 'se', 'そ': 'so',
+    'た': 'ta', 'ち': 'chi', 'つ': 'tsu', 'て': 'te', 'と': 'to',
+    'な': 'na', 'に': 'ni', 'ぬ': 'nu', 'ね': 'ne', 'の': 'no',
+    'は': 'ha', 'ひ': 'hi', 'ふ': 'fu', 'へ': 'he', 'ほ': 'ho',
+    'ま': 'ma', 'み': 'mi', 'む': 'mu', 'め': 'me', 'も': 'mo',
+    'や': 'ya', 'ゆ': 'yu', 'よ': 'yo',
+    'ら': 'ra', 'り': 'ri', 'る': 'ru', 'れ': 're', 'ろ': 'ro',
+    'わ': 'wa', 'を': 'wo', 'ん': 'n',
+    'が': 'ga', 'ぎ': 'gi', 'ぐ': 'gu', 'げ': 'ge', 'ご': 'go',
+    'ざ': 'za', 'じ': 'ji', 'ず': 'zu', 'ぜ': 'ze', 'ぞ': 'zo',
+    'だ': 'da', 'ぢ': 'di', 'づ': 'du', 'で': 'de', 'ど': 'do',
+    'ば': 'ba', 'び': 'bi', 'ぶ': 'bu', 'べ': 'be', 'ぼ': 'bo',
+    'ぱ': 'pa', 'ぴ': 'pi', 'ぷ': 'pu', 'ぺ': 'pe', 'ぽ': 'po',
+    'きゃ': 'kya', 'きゅ': 'kyu', 'きょ': 'kyo',
+    'しゃ': 'sha', 'しゅ': 'shu', 'しょ': 'sho',
+    'ちゃ': 'cha', 'ちゅ': 'chu', 'ちょ': 'cho',
+    'にゃ': 'nya', 'にゅ': 'nyu', 'にょ': 'nyo',
+    'ひゃ': 'hya', 'ひゅ': 'hyu', 'ひょ': 'hyo',
+    'みゃ': 'mya', 'みゅ': 'myu', 'みょ': 'myo',
+    'りゃ': 'rya', 'りゅ': 'ryu', 'りょ': 'ryo',
+    'ぎゃ': 'gya', 'ぎゅ': 'gyu', 'ぎょ': 'gyo',
+    'じゃ': 'ja', 'じゅ': 'ju', 'じょ': 'jo',
+    'びゃ': 'bya', 'びゅ': 'byu', 'びょ': 'byo',
+    'ぴゃ': 'pya', 'ぴゅ': 'pyu', 'ぴょ': 'pyo',
+    'っ': '',  # Small tsu - double next consonant
+    'ー': '',  # Long vowel mark
+}
+
+# Katakana to romaji mapping
+_KATA_ROMAJI: Dict[str, str] = {
+    'ア': 'a', 'イ': 'i', 'ウ': 'u', 'エ': 'e', 'オ': 'o',
+    'カ': 'ka', 'キ': 'ki', 'ク': 'ku', 'ケ': 'ke', 'コ': 'ko',
+    'サ': 'sa', 'シ': 'shi', 'ス': 'su', 'セ': 'se', 'ソ': 'so',
+    'タ': 'ta', 'チ': 'chi', 'ツ': 'tsu', 'テ': 'te', 'ト': 'to',
+    'ナ': 'na', 'ニ': 'ni', 'ヌ': 'nu', 'ネ': 'ne', 'ノ': 'no',
+    'ハ': 'ha', 'ヒ': 'hi', 'フ': 'fu', 'ヘ': 'he', 'ホ': 'ho',
+    'マ': 'ma', 'ミ': 'mi', 'ム': 'mu', 'メ': 'me', 'モ': 'mo',
+    'ヤ': 'ya', 'ユ': 'yu', 'ヨ': 'yo',
+    'ラ': 'ra', 'リ': 'ri', 'ル': 'ru', 'レ': 're', 'ロ': 'ro',
+    'ワ': 'wa', 'ヲ': 'wo', 'ン': 'n',
+    'ガ': 'ga', 'ギ': 'gi', 'グ': 'gu', 'ゲ': 'ge', 'ゴ': 'go',
+    'ザ': 'za', 'ジ': 'ji', 'ズ': 'zu', 'ゼ': 'ze', 'ゾ': 'zo',
+    'ダ': 'da', 'ヂ': 'di', 'ヅ': 'du', 'デ': 'de', 'ド': 'do',
+    'バ': 'ba', 'ビ': 'bi', 'ブ': 'bu', 'ベ': 'be', 'ボ': 'bo',
+    'パ': 'pa', 'ピ': 'pi', 'プ': 'pu', 'ペ': 'pe', 'ポ': 'po',
+    'キャ': 'kya', 'キュ': 'kyu', 'キョ': 'kyo',
+    'シャ': 'sha', 'シュ': 'shu', 'ショ': 'sho',
+    'チャ': 'cha', 'チュ': 'chu', 'チョ': 'cho',
+    'ニャ': 'nya', 'ニュ': 'nyu', 'ニョ': 'nyo',
+    'ヒャ': 'hya', 'ヒュ': 'hyu', 'ヒョ': 'hyo',
+    'ミャ': 'mya', 'ミュ': 'myu', 'ミョ': 'myo',
+    'リャ': 'rya', 'リュ': 'ryu', 'リョ': 'ryo',
+    'ギャ': 'gya', 'ギュ': 'gyu', 'ギョ': 'gyo',
+    'ジャ': 'ja', 'ジュ': 'ju', 'ジョ': 'jo',
+    'ビャ': 'bya', 'ビュ': 'byu', 'ビョ': 'byo',
+    'ピャ': 'pya', 'ピュ': 'pyu', 'ピョ': 'pyo',
+    'ッ': '',  # Small tsu
+    'ー': '',  # Long vowel mark
+    'ァ': 'a', 'ィ': 'i', 'ゥ': 'u', 'ェ': 'e', 'ォ': 'o',  # Small vowels
+    'ヴ': 'vu',  # V sound
+}
+
+
+def _kana_pattern(romaji_map: Dict[str, str], small_tsu: str) -> re.Pattern:
+    """
+    Compile the multi-character part of a kana table into one trie-shaped
+    pattern: small tsu (with the next character captured by a lookahead)
+    and digraphs. Single kana are left to _kana_singles().
+
+    Digraph first characters sharing the same set of small-kana seconds
+    collapse into a single [firsts][seconds] pair, so each position costs a
+    couple of set tests rather than a walk over literal alternatives.
+    """
+    seconds: Dict[str, set] = {}
+    for kana in romaji_map:
+        if len(kana) == 2:
+            seconds.setdefault(kana[0], set()).add(kana[1])
+
+    firsts_by_seconds: Dict[frozenset, List[str]] = {}
+    for first, second_set in seconds.items():
+        firsts_by_seconds.setdefault(frozenset(second_set), []).append(first)
+
+    def char_class(chars) -> str:
+        return '[' + ''.join(map(re.escape, sorted(chars))) + ']'
+
+    branches = [re.escape(small_tsu) + '(?=(.?))']
+    branches.extend(
+        char_class(firsts) + char_class(second_set)
+        for second_set, firsts in firsts_by_seconds.items()
+    )
+    return re.compile('|'.join(branches), re.DOTALL)
+
+
+# One past the end of the katakana block (U+30A0-U+30FF)
+_KANA_TABLE_SIZE = 0x3100
+
+
+def _kana_singles(romaji_map: Dict[str, str], small_tsu: str, skip: str = '') -> List[str]:
+    """
+    Translation table for the single kana left over by a _kana_pattern()
+    pass; str.translate maps them in one C-level scan instead of a Python
+    callback per character.
+
+    The table is a list indexed directly by codepoint rather than a dict, so
+    each lookup is a subscript instead of a hash probe. Non-kana below the
+    kana blocks map to themselves, and anything above (kanji, fullwidth
+    forms) falls off the end, which str.translate leaves unchanged.
+    """
+    table = [chr(code) for code in range(_KANA_TABLE_SIZE)]
+    for kana, romaji in romaji_map.items():
+        if len(kana) == 1 and kana != small_tsu and kana not in skip:
+            table[ord(kana)] = romaji
+    return table
+
+
+def _kana_replacer(romaji_map: Dict[str, str]):
+    """Match -> romaji callback for a _kana_pattern() substitution."""
+    def replace(match: re.Match) -> str:
+        next_char = match.group(1)
+        if next_char is None:
+            return romaji_map[match.group()]
+        # Small tsu - double the next consonant
+        next_romaji = romaji_map.get(next_char)
+        return next_romaji[0] if next_romaji else ''
+    return replace
+
+
+_HIRA_PATTERN = _kana_pattern(_HIRA_ROMAJI, 'っ')
+_HIRA_REPLACE = _kana_replacer(_HIRA_ROMAJI)
+_HIRA_SINGLES = _kana_singles(_HIRA_ROMAJI, 'っ')
+# ー is left in place by the katakana pass and resolved afterwards, since it
+# depends on the romaji already emitted before it
+_KATA_PATTERN = _kana_pattern(_KATA_ROMAJI, 'ッ')
+_KATA_REPLACE = _kana_replacer(_KATA_ROMAJI)
+_KATA_SINGLES = _kana_singles(_KATA_ROMAJI, 'ッ', skip='ー')
+_LONG_VOWEL_RE = re.compile(r'([aeiou]?)(ー+)')
+
+
+def _repeat_long_vowel(match: re.Match) -> str:
+    """Each ー repeats the vowel right before it, or is dropped."""
+    return match.group(1) * (len(match.group(2)) + 1)
 
 
-@dataclass
+_ITERATION_MARKS = '々ゝゞヽヾ'
+_VOICED_ITERATION_MARKS = 'ゞヾ'
+
+
+def _expand_iteration_marks(text: str) -> str:
+    """
+    Replace each iteration mark with the character it repeats (時々 -> 時時,
+    すゞ -> すず), so the kana tables see the syllable rather than passing the
+    mark through as an unknown character.
+    """
+    if not any(mark in text for mark in _ITERATION_MARKS):
+        return text
+
+    chars: List[str] = []
+    for char in text:
+        if char in _ITERATION_MARKS and chars:
+            repeated = chars[-1]
+            if char in _VOICED_ITERATION_MARKS:
+                # Compose with the combining dakuten; kana without a voiced
+                # form are repeated unchanged
+                voiced = unicodedata.normalize('NFC', repeated + '\u3099')
+                if len(voiced) == 1:
+                    repeated = voiced
+            chars.append(repeated)
+        else:
+            chars.append(char)
+    return ''.join(chars)
+
+
+# Romanization is a pure function of the reading, and the same readings recur
+# across sections and chapters, so each unique string is converted once
+@lru_cache(maxsize=4096)
+def _romanize_hiragana_cached(hiragana: str) -> str:
+    """Convert hiragana to romanized form."""
+    # Unknown characters are kept as-is
+    hiragana = _expand_iteration_marks(hiragana)
+    romanized = _HIRA_PATTERN.sub(_HIRA_REPLACE, hiragana)
+    return romanized.translate(_HIRA_SINGLES).capitalize()
+
+
+@lru_cache(maxsize=4096)
+def _romanize_katakana_cached(katakana: str) -> str:
+    """Convert katakana to romanized form."""
+    katakana = _expand_iteration_marks(katakana)
+    romanized = _KATA_PATTERN.sub(_KATA_REPLACE, katakana).translate(_KATA_SINGLES)
+    return _LONG_VOWEL_RE.sub(_repeat_long_vowel, romanized).capitalize()
+
+
+@lru_cache(maxsize=4096)
+def _romanize_cached(text: str) -> str:
+    """
+    Convert Japanese text (hiragana/katakana) to romanized form.
+
+    Args:
+        text: Japanese text (hiragana or katakana)
+
+    Returns:
+        Romanized string
+    """
+    # Detect if primarily katakana or hiragana, in one pass over the text
+    katakana_count = hiragana_count = 0
+    for char in text:
+        code = ord(char)
+        if 0x30A0 <= code <= 0x30FF:
+            katakana_count += 1
+        elif 0x3040 <= code <= 0x309F:
+            hiragana_count += 1
+
+    if katakana_count > hiragana_count:
+        return _romanize_katakana_cached(text)
+    else:
+        return _romanize_hiragana_cached(text)
+
+
+
+@lru_cache(maxsize=8)
+def _load_template_file(path: Path) -> str:
+    """Read a prompt template once per process; missing files read as empty."""
+    return path.read_text(encoding='utf-8') if path.exists() else ""
+
+
+# Readings are NFKC-normalized before the cache lookup, so half-width ｶﾀｶﾅ,
+# decomposed dakuten etc. hit the kana tables and share a cache slot with
+# their canonical full-width forms
+def _romanize(text: str) -> str:
+    """Romanize a kana reading (hiragana or katakana auto-detected)."""
+    # Already-romanized readings have nothing to convert
+    if text.isascii():
+        return text.capitalize()
+    return _romanize_cached(unicodedata.normalize('NFKC', text))
+
+
+def _romanize_hiragana(hiragana: str) -> str:
+    """Romanize a hiragana reading."""
+    return _romanize_hiragana_cached(unicodedata.normalize('NFKC', hiragana))
+
+
+def _romanize_katakana(katakana: str) -> str:
+    """Romanize a katakana reading."""
+    return _romanize_katakana_cached(unicodedata.normalize('NFKC', katakana))
+
+# RubyEntry name_type -> generate_prompt() category; anything else is 'standard'
+_TYPE_BUCKET: Dict[str, str] = {
+    'kirakira': 'kirakira',
+    'unusual_reading': 'unusual_reading',
+    'archaic': 'unusual_reading',
+    'fragmented': 'fragmented',
+}
+
+# Static prompt text, assembled once; section generators only fill in the
+# per-name {body} lines
+_PROMPT_HEADER = (
+    "## IRREGULAR NAME HANDLING\n"
+    "\n"
+    "This text contains character names with non-standard readings or patterns.\n"
+    "Pay special attention to preserve the author's naming intentions.\n"
+)
+
+_KIRAKIRA_TEMPLATE = (
+    "### Kira-Kira Name Pattern Detected\n"
+    "\n"
+    "The following characters have \"kira-kira\" names where the kanji reading\n"
+    "differs dramatically from standard readings:\n"
+    "\n"
+    "{body}\n"
+    "\n"
+    "**Translation Guidelines:**\n"
+    "1. Use the KATAKANA reading as the romanized name (not the kanji reading)\n"
+    "2. If the text explicitly comments on the unusual name (e.g., calling it a\n"
+    "   \"kira-kira name\" or キラキラネーム), preserve that commentary\n"
+    "3. Maintain consistency - use the same romanization throughout\n"
+)
+
+_UNUSUAL_READING_TEMPLATE = (
+    "### Unusual Name Reading Detected\n"
+    "\n"
+    "The following character names have non-standard readings:\n"
+    "\n"
+    "{body}\n"
+    "\n"
+    "**Translation Guidelines:**\n"
+    "1. The furigana reading is the ACTUAL pronunciation - use it for romanization\n"
+    "2. Do NOT \"correct\" the reading to a more common one\n"
+    "3. If other characters comment on the unusual name, translate that commentary\n"
+)
+
+_FRAGMENTED_TEMPLATE = (
+    "### Fragmented Name Pattern\n"
+    "\n"
+    "The following character names appear in fragments across different POVs:\n"
+    "\n"
+    "{body}\n"
+    "\n"
+    "**Translation Guidelines:**\n"
+    "1. Track which name portion is used in each POV\n"
+    "2. Preserve the intimacy/distance implied by name choice\n"
+    "3. When assembling full names, use provided readings\n"
+)
+
+_CHARACTER_LIST_TEMPLATE = (
+    "### Character Name Reference\n"
+    "\n"
+    "The following character names appear in this text:\n"
+    "\n"
+    "{body}\n"
+)
+
+# generate_prompt() bucket order, with each bucket's section template, bullet
+# label and note line format (None: notes omitted)
+_SECTION_FORMATS: Dict[str, Tuple[str, str, Optional[str]]] = {
+    'kirakira': (_KIRAKIRA_TEMPLATE, "Romanize as", "  - Note: {}"),
+    'unusual_reading': (_UNUSUAL_READING_TEMPLATE, "Romanize as", "  - Note: {}"),
+    'fragmented': (_FRAGMENTED_TEMPLATE, "Full name", "  - {}"),
+    'standard': (_CHARACTER_LIST_TEMPLATE, "", None),
+}
+
+
+def _format_bullet(kanji: str, reading: str, romanized: str, label: str = "Romanize as") -> str:
+    """One name bullet line; an empty label leaves just the romanization."""
+    if label:
+        return f"- **{kanji}** ({reading}) → {label}: **{romanized}**"
+    return f"- **{kanji}** ({reading}) → **{romanized}**"
+
+
+@dataclass(slots=True)
 class NamePattern:
     """Represents a detected name pattern for prompt generation."""
     kanji: str
@@ -42,147 +375,18 @@ class NamePromptGenerator:
             template_path = Path(__file__).parent / "irregular_names_module.xml"
 
         self.template_path = template_path
-        self._template_cache: Optional[str] = None
 
     def _load_template(self) -> str:
-        """Load and cache the XML template."""
-        if self._template_cache is None:
-            if self.template_path.exists():
-                self._template_cache = self.template_path.read_text(encoding='utf-8')
-            else:
-                self._template_cache = ""
-        return self._template_cache
+        """Load the XML template (cached per path across instances)."""
+        return _load_template_file(self.template_path)
 
     def _romanize_hiragana(self, hiragana: str) -> str:
         """Convert hiragana to romanized form."""
-        # Basic hiragana to romaji mapping
-        romaji_map = {
-            'あ': 'a', 'い': 'i', 'う': 'u', 'え': 'e', 'お': 'o',
-            'か': 'ka', 'き': 'ki', 'く': 'ku', 'け': 'ke', 'こ': 'ko',
-            'さ': 'sa', 'し': 'shi', 'す': 'su', 'せ': 'se', 'そ': 'so',
-            'た': 'ta', 'ち': 'chi', 'つ': 'tsu', 'て': 'te', 'と': 'to',
-            'な': 'na', 'に': 'ni', 'ぬ': 'nu', 'ね': 'ne', 'の': 'no',
-            'は': 'ha', 'ひ': 'hi', 'ふ': 'fu', 'へ': 'he', 'ほ': 'ho',
-            'ま': 'ma', 'み': 'mi', 'む': 'mu', 'め': 'me', 'も': 'mo',
-            'や': 'ya', 'ゆ': 'yu', 'よ': 'yo',
-            'ら': 'ra', 'り': 'ri', 'る': 'ru', 'れ': 're', 'ろ': 'ro',
-            'わ': 'wa', 'を': 'wo', 'ん': 'n',
-            'が': 'ga', 'ぎ': 'gi', 'ぐ': 'gu', 'げ': 'ge', 'ご': 'go',
-            'ざ': 'za', 'じ': 'ji', 'ず': 'zu', 'ぜ': 'ze', 'ぞ': 'zo',
-            'だ': 'da', 'ぢ': 'di', 'づ': 'du', 'で': 'de', 'ど': 'do',
-            'ば': 'ba', 'び': 'bi', 'ぶ': 'bu', 'べ': 'be', 'ぼ': 'bo',
-            'ぱ': 'pa', 'ぴ': 'pi', 'ぷ': 'pu', 'ぺ': 'pe', 'ぽ': 'po',
-            'きゃ': 'kya', 'きゅ': 'kyu', 'きょ': 'kyo',
-            'しゃ': 'sha', 'しゅ': 'shu', 'しょ': 'sho',
-            'ちゃ': 'cha', 'ちゅ': 'chu', 'ちょ': 'cho',
-            'にゃ': 'nya', 'にゅ': 'nyu', 'にょ': 'nyo',
-            'ひゃ': 'hya', 'ひゅ': 'hyu', 'ひょ': 'hyo',
-            'みゃ': 'mya', 'みゅ': 'myu', 'みょ': 'myo',
-            'りゃ': 'rya', 'りゅ': 'ryu', 'りょ': 'ryo',
-            'ぎゃ': 'gya', 'ぎゅ': 'gyu', 'ぎょ': 'gyo',
-            'じゃ': 'ja', 'じゅ': 'ju', 'じょ': 'jo',
-            'びゃ': 'bya', 'びゅ': 'byu', 'びょ': 'byo',
-            'ぴゃ': 'pya', 'ぴゅ': 'pyu', 'ぴょ': 'pyo',
-            'っ': '',  # Small tsu - double next consonant
-            'ー': '',  # Long vowel mark
-        }
-
-        result = []
-        i = 0
-        while i < len(hiragana):
-            # Check for two-character combinations first
-            if i + 1 < len(hiragana):
-                combo = hiragana[i:i+2]
-                if combo in romaji_map:
-                    result.append(romaji_map[combo])
-                    i += 2
-                    continue
-
-            # Single character
-            char = hiragana[i]
-            if char in romaji_map:
-                # Handle small tsu (っ) - double next consonant
-                if char == 'っ' and i + 1 < len(hiragana):
-                    next_char = hiragana[i + 1]
-                    if next_char in romaji_map and romaji_map[next_char]:
-                        result.append(romaji_map[next_char][0])  # Double the consonant
-                else:
-                    result.append(romaji_map[char])
-            else:
-                result.append(char)  # Keep unknown characters as-is
-            i += 1
-
-        # Capitalize first letter of each word
-        romanized = ''.join(result)
-        return romanized.capitalize()
+        return _romanize_hiragana(hiragana)
 
     def _romanize_katakana(self, katakana: str) -> str:
         """Convert katakana to romanized form."""
-        # Katakana to romaji mapping
-        romaji_map = {
-            'ア': 'a', 'イ': 'i', 'ウ': 'u', 'エ': 'e', 'オ': 'o',
-            'カ': 'ka', 'キ': 'ki', 'ク': 'ku', 'ケ': 'ke', 'コ': 'ko',
-            'サ': 'sa', 'シ': 'shi', 'ス': 'su', 'セ': 'se', 'ソ': 'so',
-            'タ': 'ta', 'チ': 'chi', 'ツ': 'tsu', 'テ': 'te', 'ト': 'to',
-            'ナ': 'na', 'ニ': 'ni', 'ヌ': 'nu', 'ネ': 'ne', 'ノ': 'no',
-            'ハ': 'ha', 'ヒ': 'hi', 'フ': 'fu', 'ヘ': 'he', 'ホ': 'ho',
-            'マ': 'ma', 'ミ': 'mi', 'ム': 'mu', 'メ': 'me', 'モ': 'mo',
-            'ヤ': 'ya', 'ユ': 'yu', 'ヨ': 'yo',
-            'ラ': 'ra', 'リ': 'ri', 'ル': 'ru', 'レ': 're', 'ロ': 'ro',
-            'ワ': 'wa', 'ヲ': 'wo', 'ン': 'n',
-            'ガ': 'ga', 'ギ': 'gi', 'グ': 'gu', 'ゲ': 'ge', 'ゴ': 'go',
-            'ザ': 'za', 'ジ': 'ji', 'ズ': 'zu', 'ゼ': 'ze', 'ゾ': 'zo',
-            'ダ': 'da', 'ヂ': 'di', 'ヅ': 'du', 'デ': 'de', 'ド': 'do',
-            'バ': 'ba', 'ビ': 'bi', 'ブ': 'bu', 'ベ': 'be', 'ボ': 'bo',
-            'パ': 'pa', 'ピ': 'pi', 'プ': 'pu', 'ペ': 'pe', 'ポ': 'po',
-            'キャ': 'kya', 'キュ': 'kyu', 'キョ': 'kyo',
-            'シャ': 'sha', 'シュ': 'shu', 'ショ': 'sho',
-            'チャ': 'cha', 'チュ': 'chu', 'チョ': 'cho',
-            'ニャ': 'nya', 'ニュ': 'nyu', 'ニョ': 'nyo',
-            'ヒャ': 'hya', 'ヒュ': 'hyu', 'ヒョ': 'hyo',
-            'ミャ': 'mya', 'ミュ': 'myu', 'ミョ': 'myo',
-            'リャ': 'rya', 'リュ': 'ryu', 'リョ': 'ryo',
-            'ギャ': 'gya', 'ギュ': 'gyu', 'ギョ': 'gyo',
-            'ジャ': 'ja', 'ジュ': 'ju', 'ジョ': 'jo',
-            'ビャ': 'bya', 'ビュ': 'byu', 'ビョ': 'byo',
-            'ピャ': 'pya', 'ピュ': 'pyu', 'ピョ': 'pyo',
-            'ッ': '',  # Small tsu
-            'ー': '',  # Long vowel mark
-            'ァ': 'a', 'ィ': 'i', 'ゥ': 'u', 'ェ': 'e', 'ォ': 'o',  # Small vowels
-            'ヴ': 'vu',  # V sound
-        }
-
-        result = []
-        i = 0
-        while i < len(katakana):
-            # Check for two-character combinations first
-            if i + 1 < len(katakana):
-                combo = katakana[i:i+2]
-                if combo in romaji_map:
-                    result.append(romaji_map[combo])
-                    i += 2
-                    continue
-
-            # Single character
-            char = katakana[i]
-            if char in romaji_map:
-                # Handle small tsu (ッ) - double next consonant
-                if char == 'ッ' and i + 1 < len(katakana):
-                    next_char = katakana[i + 1]
-                    if next_char in romaji_map and romaji_map[next_char]:
-                        result.append(romaji_map[next_char][0])
-                elif char == 'ー' and result:
-                    # Long vowel - repeat last vowel
-                    last = result[-1]
-                    if last and last[-1] in 'aeiou':
-                        result.append(last[-1])
-                else:
-                    result.append(romaji_map[char])
-            else:
-                result.append(char)
-            i += 1
-
-        return ''.join(result).capitalize()
+        return _romanize_katakana(katakana)
 
     def romanize(self, text: str) -> str:
         """
@@ -194,17 +398,7 @@ class NamePromptGenerator:
         Returns:
             Romanized string
         """
-        # Detect if primarily katakana or hiragana
-        katakana_pattern = re.compile(r'[\u30A0-\u30FF]')
-        hiragana_pattern = re.compile(r'[\u3040-\u309F]')
-
-        katakana_count = len(katakana_pattern.findall(text))
-        hiragana_count = len(hiragana_pattern.findall(text))
-
-        if katakana_count > hiragana_count:
-            return self._romanize_katakana(text)
-        else:
-            return self._romanize_hiragana(text)
+        return _romanize(text)
 
     def generate_kirakira_section(self, names: List[NamePattern]) -> str:
         """
@@ -219,31 +413,14 @@ class NamePromptGenerator:
         if not names:
             return ""
 
-        lines = [
-            "### Kira-Kira Name Pattern Detected",
-            "",
-            "The following characters have \"kira-kira\" names where the kanji reading",
-            "differs dramatically from standard readings:",
-            ""
-        ]
-
+        lines = []
         for name in names:
-            romanized = name.romanized or self._romanize_katakana(name.reading)
-            lines.append(f"- **{name.kanji}** ({name.reading}) → Romanize as: **{romanized}**")
+            romanized = name.romanized or _romanize(name.reading)
+            lines.append(_format_bullet(name.kanji, name.reading, romanized))
             if name.notes:
                 lines.append(f"  - Note: {name.notes}")
 
-        lines.extend([
-            "",
-            "**Translation Guidelines:**",
-            "1. Use the KATAKANA reading as the romanized name (not the kanji reading)",
-            "2. If the text explicitly comments on the unusual name (e.g., calling it a",
-            "   \"kira-kira name\" or キラキラネーム), preserve that commentary",
-            "3. Maintain consistency - use the same romanization throughout",
-            ""
-        ])
-
-        return "\n".join(lines)
+        return _KIRAKIRA_TEMPLATE.format(body="\n".join(lines))
 
     def generate_unusual_reading_section(self, names: List[NamePattern]) -> str:
         """
@@ -258,29 +435,14 @@ class NamePromptGenerator:
         if not names:
             return ""
 
-        lines = [
-            "### Unusual Name Reading Detected",
-            "",
-            "The following character names have non-standard readings:",
-            ""
-        ]
-
+        lines = []
         for name in names:
-            romanized = name.romanized or self.romanize(name.reading)
-            lines.append(f"- **{name.kanji}** ({name.reading}) → Romanize as: **{romanized}**")
+            romanized = name.romanized or _romanize(name.reading)
+            lines.append(_format_bullet(name.kanji, name.reading, romanized))
             if name.notes:
                 lines.append(f"  - Note: {name.notes}")
 
-        lines.extend([
-            "",
-            "**Translation Guidelines:**",
-            "1. The furigana reading is the ACTUAL pronunciation - use it for romanization",
-            "2. Do NOT \"correct\" the reading to a more common one",
-            "3. If other characters comment on the unusual name, translate that commentary",
-            ""
-        ])
-
-        return "\n".join(lines)
+        return _UNUSUAL_READING_TEMPLATE.format(body="\n".join(lines))
 
     def generate_fragmented_section(self, names: List[NamePattern]) -> str:
         """
@@ -295,29 +457,14 @@ class NamePromptGenerator:
         if not names:
             return ""
 
-        lines = [
-            "### Fragmented Name Pattern",
-            "",
-            "The following character names appear in fragments across different POVs:",
-            ""
-        ]
-
+        lines = []
         for name in names:
-            romanized = name.romanized or self.romanize(name.reading)
-            lines.append(f"- **{name.kanji}** ({name.reading}) → Full name: **{romanized}**")
+            romanized = name.romanized or _romanize(name.reading)
+            lines.append(_format_bullet(name.kanji, name.reading, romanized, "Full name"))
             if name.notes:
                 lines.append(f"  - {name.notes}")
 
-        lines.extend([
-            "",
-            "**Translation Guidelines:**",
-            "1. Track which name portion is used in each POV",
-            "2. Preserve the intimacy/distance implied by name choice",
-            "3. When assembling full names, use provided readings",
-            ""
-        ])
-
-        return "\n".join(lines)
+        return _FRAGMENTED_TEMPLATE.format(body="\n".join(lines))
 
     def generate_character_list_section(self, names: List[NamePattern]) -> str:
         """
@@ -332,20 +479,12 @@ class NamePromptGenerator:
         if not names:
             return ""
 
-        lines = [
-            "### Character Name Reference",
-            "",
-            "The following character names appear in this text:",
-            ""
-        ]
-
+        lines = []
         for name in names:
-            romanized = name.romanized or self.romanize(name.reading)
-            lines.append(f"- **{name.kanji}** ({name.reading}) → **{romanized}**")
-
-        lines.append("")
+            romanized = name.romanized or _romanize(name.reading)
+            lines.append(_format_bullet(name.kanji, name.reading, romanized, ""))
 
-        return "\n".join(lines)
+        return _CHARACTER_LIST_TEMPLATE.format(body="\n".join(lines))
 
     def generate_from_ruby_entries(self, entries: List[Any]) -> str:
         """
@@ -357,50 +496,18 @@ class NamePromptGenerator:
         Returns:
             Complete prompt text for injection
         """
-        # Convert RubyEntry objects to NamePattern objects
-        patterns: Dict[str, List[NamePattern]] = {
-            'kirakira': [],
-            'unusual_reading': [],
-            'fragmented': [],
-            'standard': [],
-        }
-
-        for entry in entries:
-            # Handle both dict and dataclass formats
-            if hasattr(entry, 'kanji'):
-                kanji = entry.kanji
-                reading = entry.ruby
-                name_type = getattr(entry, 'name_type', 'standard')
-                notes = getattr(entry, 'notes', '')
-                context = getattr(entry, 'context', '')
-            elif isinstance(entry, dict):
-                kanji = entry.get('kanji', '')
-                reading = entry.get('ruby', entry.get('reading', ''))
-                name_type = entry.get('name_type', 'standard')
-                notes = entry.get('notes', '')
-                context = entry.get('context', '')
-            else:
-                continue
-
-            pattern = NamePattern(
-                kanji=kanji,
-                reading=reading,
-                pattern_type=name_type,
-                notes=notes,
-                context=context,
-            )
-
-            # Map name_type to pattern category
-            if name_type == 'kirakira':
-                patterns['kirakira'].append(pattern)
-            elif name_type in ('unusual_reading', 'archaic'):
-                patterns['unusual_reading'].append(pattern)
-            elif name_type == 'fragmented':
-                patterns['fragmented'].append(pattern)
-            else:
-                patterns['standard'].append(pattern)
-
-        return self.generate_prompt(patterns)
+        # The prompt depends only on these fields, and a volume's chapters
+        # mostly share one roster, so repeated rosters come from the cache
+        names = tuple(
+            fields[:4]
+            for fields in map(_extract_entry_fields, entries)
+            if fields is not None
+        )
+        try:
+            return _build_ruby_prompt(names)
+        except TypeError:
+            # Unhashable field values (e.g. a dict entry carrying a list)
+            return _build_ruby_prompt.__wrapped__(names)
 
     def generate_prompt(self, patterns: Dict[str, List[NamePattern]]) -> str:
         """
@@ -412,14 +519,7 @@ class NamePromptGenerator:
         Returns:
             Complete prompt text for injection
         """
-        sections = []
-
-        # Header
-        sections.append("## IRREGULAR NAME HANDLING")
-        sections.append("")
-        sections.append("This text contains character names with non-standard readings or patterns.")
-        sections.append("Pay special attention to preserve the author's naming intentions.")
-        sections.append("")
+        sections = [_PROMPT_HEADER]
 
         # Generate each section
         if patterns.get('kirakira'):
@@ -449,18 +549,12 @@ class NamePromptGenerator:
         lines = ["## Character Names"]
 
         for entry in entries:
-            if hasattr(entry, 'kanji'):
-                kanji = entry.kanji
-                reading = entry.ruby
-                name_type = getattr(entry, 'name_type', 'standard')
-            elif isinstance(entry, dict):
-                kanji = entry.get('kanji', '')
-                reading = entry.get('ruby', entry.get('reading', ''))
-                name_type = entry.get('name_type', 'standard')
-            else:
+            fields = _extract_entry_fields(entry)
+            if fields is None:
                 continue
+            kanji, reading, name_type = fields[:3]
 
-            romanized = self.romanize(reading)
+            romanized = _romanize(reading)
 
             if name_type == 'kirakira':
                 lines.append(f"- {kanji}→{reading} = {romanized} (kira-kira)")
@@ -470,6 +564,58 @@ class NamePromptGenerator:
         return "\n".join(lines)
 
 
+def _extract_entry_fields(entry: Any) -> Optional[Tuple[str, str, str, str, str]]:
+    """
+    Read (kanji, reading, name_type, notes, context) from a RubyEntry-like
+    object or a dict; None for anything else.
+    """
+    # Handle both dict and dataclass formats
+    if hasattr(entry, 'kanji'):
+        return (
+            entry.kanji,
+            entry.ruby,
+            getattr(entry, 'name_type', 'standard'),
+            getattr(entry, 'notes', ''),
+            getattr(entry, 'context', ''),
+        )
+    if isinstance(entry, dict):
+        return (
+            entry.get('kanji', ''),
+            entry.get('ruby', entry.get('reading', '')),
+            entry.get('name_type', 'standard'),
+            entry.get('notes', ''),
+            entry.get('context', ''),
+        )
+    return None
+
+
+@lru_cache(maxsize=256)
+def _build_ruby_prompt(names: Tuple[Tuple[str, str, str, str], ...]) -> str:
+    """
+    Assemble the prompt for (kanji, reading, name_type, notes) name tuples,
+    as read by _extract_entry_fields().
+    """
+    # Write each entry's lines straight into its section body in one
+    # pass, without building NamePattern objects to re-walk per section
+    bodies: Dict[str, List[str]] = {bucket: [] for bucket in _SECTION_FORMATS}
+    format_bullet = _format_bullet
+
+    for kanji, reading, name_type, notes in names:
+        bucket = _TYPE_BUCKET.get(name_type, 'standard')
+        _, label, note = _SECTION_FORMATS[bucket]
+        lines = bodies[bucket]
+        lines.append(format_bullet(kanji, reading, _romanize(reading), label))
+        if notes and note:
+            lines.append(note.format(notes))
+
+    sections = [_PROMPT_HEADER]
+    for bucket, (template, _, _) in _SECTION_FORMATS.items():
+        if bodies[bucket]:
+            sections.append(template.format(body="\n".join(bodies[bucket])))
+
+    return "\n".join(sections)
+
+
 def generate_name_prompt(entries: List[Any]) -> str:
     """
     Convenience function to generate prompt from ruby entries.
@@ -13,17 +13,23 @@ from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass, asdict, field
+from functools import lru_cache
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 from pipeline.common.gemini_client import GeminiClient
 from pipeline.translator.config import get_gemini_config, get_translation_config, get_model_name, get_fallback_model_name
 from pipeline.translator.prompt_loader import PromptLoader
 from pipeline.translator.context_manager import ContextManager
 from pipeline.translator.chapter_processor import ChapterProcessor, TranslationResult
-from pipeline.translator.continuity_manager import detect_and_offer_continuity, ContinuityPackManager
-from pipeline.translator.per_chapter_workflow import PerChapterWorkflow
 from pipeline.config import get_target_language, get_language_config
-from pipeline.post_processor.format_normalizer import FormatNormalizer
-from pipeline.post_processor.cjk_cleaner import CJKArtifactCleaner, format_results_report
+# Continuity, per-chapter workflow and post-processing modules are imported
+# where they are used, so CLI startup and runs that never reach them skip
+# loading them
 
 
 @dataclass
@@ -52,6 +58,49 @@ logging.basicConfig(
 )
 logger = logging.getLogger("TranslatorAgent")
 
+
+def _read_json(path: Path) -> Any:
+    """Parse a UTF-8 JSON file, with orjson when installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(path.read_bytes())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+@lru_cache(maxsize=64)
+def _read_json_cached(path_str: str, mtime_ns: int, size: int) -> Any:
+    """Parsed JSON for a (path, mtime_ns, size) key; shared, so read-only."""
+    return _read_json(Path(path_str))
+
+
+def _read_metadata_json(path: Path) -> Any:
+    """
+    Parse a metadata_{lang}.json file, reusing the previous parse while the
+    file is unchanged on disk.
+
+    The character name and semantic metadata loaders both read the same file
+    on every agent init, and batch runs create an agent per volume. Only
+    read-only files go through here: the manifest is edited in place by the
+    agent, so it is always parsed fresh.
+    """
+    st = path.stat()
+    return _read_json_cached(str(path), st.st_mtime_ns, st.st_size)
+
+
+def _write_json(path: Path, data: Any) -> None:
+    """
+    Write data as pretty-printed UTF-8 JSON.
+
+    Uses orjson when installed (encodes straight to bytes in C); otherwise
+    falls back to the stdlib encoder.
+    """
+    if ORJSON_AVAILABLE:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        return
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+
+
 class TranslatorAgent:
     def __init__(self, work_dir: Path, target_language: str = None, enable_continuity: bool = False):
         """
@@ -88,6 +137,7 @@ class TranslatorAgent:
 
         # Detect and offer continuity pack injection (only if continuity enabled)
         if enable_continuity:
+            from pipeline.translator.continuity_manager import detect_and_offer_continuity
             self.continuity_pack = detect_and_offer_continuity(work_dir, self.manifest, target_language=self.target_language)
         else:
             self.continuity_pack = None
@@ -154,6 +204,7 @@ class TranslatorAgent:
                 logger.info(f"✓ Loaded {len(continuity_glossary)} glossary terms from continuity pack")
             
             # Format and inject full continuity pack (relationships, narrative flags, etc.)
+            from pipeline.translator.continuity_manager import ContinuityPackManager
             continuity_manager = ContinuityPackManager(work_dir)
             continuity_text = continuity_manager.format_continuity_for_prompt(self.continuity_pack)
             self.prompt_loader.set_continuity_pack(continuity_text)
@@ -181,13 +232,23 @@ class TranslatorAgent:
         self.log_path = work_dir / "translation_log.json"
         self.translation_log = self._load_log()
         
-        # Per-Chapter Workflow (schema extraction, review, caching)
-        self.per_chapter_workflow = PerChapterWorkflow(
-            work_dir=work_dir,
-            target_language=self.target_language,
-            enable_caching=enable_caching,
-            gemini_client=self.client.client if hasattr(self.client, 'client') else None
-        )
+        # Per-Chapter Workflow (schema extraction, review, caching), created
+        # by the per_chapter_workflow property on first use
+        self._enable_caching = enable_caching
+        self._per_chapter_workflow = None
+
+    @property
+    def per_chapter_workflow(self):
+        """Per-chapter workflow, imported and built the first time it is needed."""
+        if self._per_chapter_workflow is None:
+            from pipeline.translator.per_chapter_workflow import PerChapterWorkflow
+            self._per_chapter_workflow = PerChapterWorkflow(
+                work_dir=self.work_dir,
+                target_language=self.target_language,
+                enable_caching=self._enable_caching,
+                gemini_client=self.client.client if hasattr(self.client, 'client') else None
+            )
+        return self._per_chapter_workflow
 
     def _load_character_names(self) -> Dict[str, str]:
         """
@@ -205,16 +266,14 @@ class TranslatorAgent:
             # Try language-specific metadata file first (preferred)
             metadata_lang_path = self.work_dir / f"metadata_{self.target_language}.json"
             if metadata_lang_path.exists():
-                with open(metadata_lang_path, 'r', encoding='utf-8') as f:
-                    metadata_lang = json.load(f)
-                    return metadata_lang.get('character_names', {})
+                metadata_lang = _read_metadata_json(metadata_lang_path)
+                return metadata_lang.get('character_names', {})
             
             # Fallback to metadata_en for backward compatibility
             metadata_en_path = self.work_dir / "metadata_en.json"
             if metadata_en_path.exists():
-                with open(metadata_en_path, 'r', encoding='utf-8') as f:
-                    metadata_en = json.load(f)
-                    return metadata_en.get('character_names', {})
+                metadata_en = _read_metadata_json(metadata_en_path)
+                return metadata_en.get('character_names', {})
             
             # Fallback to manifest.json
             if self.manifest:
@@ -257,16 +316,15 @@ class TranslatorAgent:
             # Load from metadata_{language}.json (preferred)
             metadata_lang_path = self.work_dir / f"metadata_{self.target_language}.json"
             if metadata_lang_path.exists():
-                with open(metadata_lang_path, 'r', encoding='utf-8') as f:
-                    full_metadata = json.load(f)
-                    semantic_data = self._extract_semantic_metadata(full_metadata)
+                full_metadata = _read_metadata_json(metadata_lang_path)
+                semantic_data = self._extract_semantic_metadata(full_metadata)
                     
-                    if semantic_data:
-                        schema_type = "Enhanced v2.1" if 'characters' in full_metadata else "Legacy V2 (transformed)"
-                        logger.info(f"✓ Loaded semantic metadata ({schema_type}) from {metadata_lang_path.name}")
-                        return semantic_data
-                    else:
-                        logger.debug("No semantic metadata found in metadata file")
+                if semantic_data:
+                    schema_type = "Enhanced v2.1" if 'characters' in full_metadata else "Legacy V2 (transformed)"
+                    logger.info(f"✓ Loaded semantic metadata ({schema_type}) from {metadata_lang_path.name}")
+                    return semantic_data
+                else:
+                    logger.debug("No semantic metadata found in metadata file")
             
             # Fallback to manifest.json
             if self.manifest:
@@ -514,25 +572,21 @@ class TranslatorAgent:
         return patterns
 
     def _load_manifest(self) -> Dict:
-        with open(self.manifest_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return _read_json(self.manifest_path)
 
     def _save_manifest(self):
-        with open(self.manifest_path, 'w', encoding='utf-8') as f:
-            json.dump(self.manifest, f, indent=2, ensure_ascii=False)
+        _write_json(self.manifest_path, self.manifest)
 
     def _load_log(self) -> Dict:
         if self.log_path.exists():
             try:
-                with open(self.log_path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                return _read_json(self.log_path)
             except Exception:
                 return {"chapters": []}
         return {"chapters": []}
 
     def _save_log(self):
-        with open(self.log_path, 'w', encoding='utf-8') as f:
-            json.dump(self.translation_log, f, indent=2, ensure_ascii=False)
+        _write_json(self.log_path, self.translation_log)
     
     def _prewarm_cache(self):
         """Pre-warm context cache with system instruction before translation starts."""
@@ -776,6 +830,7 @@ class TranslatorAgent:
             logger.info("POST-PROCESSING: Format Normalization")
             logger.info("="*60)
             try:
+                from pipeline.post_processor.format_normalizer import FormatNormalizer
                 normalizer = FormatNormalizer(aggressive=False)
                 results = normalizer.normalize_volume(self.work_dir)
                 
@@ -793,6 +848,7 @@ class TranslatorAgent:
             logger.info("POST-PROCESSING: CJK Artifact Detection")
             logger.info("="*60)
             try:
+                from pipeline.post_processor.cjk_cleaner import CJKArtifactCleaner, format_results_report
                 # Use detection-only mode (strict_mode=False) to flag artifacts without auto-removal
                 cjk_cleaner = CJKArtifactCleaner(strict_mode=False, min_confidence=0.7, context_window=5)
                 cjk_results = cjk_cleaner.clean_volume(self.work_dir)
@@ -808,10 +864,19 @@ class TranslatorAgent:
             except Exception as e:
                 logger.warning(f"CJK artifact detection failed: {e}")
             
+            # Both passes are done; release the chapter files they memoized
+            from pipeline.post_processor.file_cache import clear_cache
+            clear_cache()
+            
             # Finalize continuity pack (aggregate all chapter snapshots)
             logger.info("\nFinalizing continuity pack...")
             try:
-                pack_summary = self.per_chapter_workflow.finalize()
+                # Snapshots only come from the workflow; skip building it
+                # when no chapter went through it
+                if self._per_chapter_workflow is None:
+                    pack_summary = {}
+                else:
+                    pack_summary = self._per_chapter_workflow.finalize()
                 logger.info(f"✓ Continuity pack finalized with {len(pack_summary.get('chapter_snapshots', []))} snapshots")
             except Exception as e:
                 logger.error(f"Failed to finalize continuity pack: {e}")
@@ -819,6 +884,7 @@ class TranslatorAgent:
             # Save continuity pack for future volumes (old system for backward compat)
             logger.info("Saving legacy continuity pack format...")
             try:
+                from pipeline.translator.continuity_manager import ContinuityPackManager
                 continuity_manager = ContinuityPackManager(self.work_dir)
                 pack = continuity_manager.extract_continuity_from_volume(self.work_dir, self.manifest, target_language=self.target_language)
                 continuity_manager.save_continuity_pack(pack)